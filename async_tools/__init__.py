@@ -2,13 +2,31 @@
 from importlib.metadata import version
 
 # Project
+from .hedge import LatencyQuantile, hedge
 from .expires import Expires as expires
 from .loopable import Loopable
 from .all_tasks import all_tasks
+from .care_group import CareGroup
+from .eager_task import eager_task
 from .current_task import current_task
-from .attempt_await import attempt_await
-from .wait_with_care import ALL_COMPLETED, FIRST_COMPLETED, FIRST_EXCEPTION, wait_with_care
-from .at_loop_shutdown import at_loop_shutdown
+from .attempt_await import maybe_await, attempt_await
+from .wait_with_care import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    wait_with_care,
+    as_completed_with_care,
+)
+from .drain_executors import drain_executor, drain_executors
+from .at_loop_shutdown import (
+    CLOSE,
+    DRAIN,
+    FLUSH,
+    STOP_INTAKE,
+    at_loop_shutdown,
+    set_shutdown_budget,
+)
+from .error_aggregator import ErrorAggregator
 from .get_running_loop import get_running_loop
 from .is_coroutine_function import is_coroutine_function
 from .shutdown_default_executor import shutdown_default_executor
@@ -25,17 +43,31 @@ except Exception:  # pragma: no cover
 
 __all__ = (
     "__version__",
+    "hedge",
     "expires",
     "Loopable",
+    "CareGroup",
+    "eager_task",
+    "LatencyQuantile",
     "all_tasks",
     "current_task",
+    "maybe_await",
     "attempt_await",
+    "ErrorAggregator",
     "ALL_COMPLETED",
     "wait_with_care",
+    "as_completed_with_care",
     "FIRST_COMPLETED",
     "FIRST_EXCEPTION",
     "get_running_loop",
     "at_loop_shutdown",
+    "set_shutdown_budget",
+    "STOP_INTAKE",
+    "DRAIN",
+    "FLUSH",
+    "CLOSE",
     "is_coroutine_function",
     "shutdown_default_executor",
+    "drain_executor",
+    "drain_executors",
 )
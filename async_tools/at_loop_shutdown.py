@@ -1,11 +1,28 @@
 # Internal
 import typing as T
-from asyncio import AbstractEventLoop, get_running_loop
+from asyncio import Future, AbstractEventLoop, wait, get_running_loop
 from weakref import WeakKeyDictionary
 
 # Project
-from .attempt_await import attempt_await
-from .wait_with_care import wait_with_care
+from .attempt_await import maybe_await
+from .wait_with_care import _check, wait_with_care
+
+# Shutdown phases, run one after the other. Callbacks of the same phase run concurrently
+# Stop accepting new work (close servers, unsubscribe from queues)
+STOP_INTAKE = "STOP_INTAKE"
+# Wait for in-flight work to finish
+DRAIN = "DRAIN"
+# Persist buffered state (flush writers, commit offsets, send pending metrics)
+FLUSH = "FLUSH"
+# Release resources (connections, executors, files)
+CLOSE = "CLOSE"
+
+PHASES = (STOP_INTAKE, DRAIN, FLUSH, CLOSE)
+
+_Callback = T.Callable[[AbstractEventLoop], T.Any]
+
+# Time, in seconds, given to cancelled overrun callbacks to finish before the next phase
+_CANCEL_GRACE = 0.1
 
 
 class ShutdownCallablesMeta(type):
@@ -23,10 +40,15 @@ class ShutdownCallablesMeta(type):
         return shutdown_callbacks
 
 
+async def _call(callback: _Callback, loop: AbstractEventLoop) -> None:
+    await maybe_await(callback(loop))
+
+
 class ShutdownCallables(metaclass=ShutdownCallablesMeta):
     def __init__(self, **__: T.Any) -> None:
+        self.budgets: T.Dict[str, T.Optional[float]] = dict.fromkeys(PHASES)
         self._schedule: T.Optional[T.AsyncGenerator[None, None]] = None
-        self._callbacks: T.List[T.Callable[[AbstractEventLoop], T.Any]] = []
+        self._callbacks: T.Dict[str, T.List[_Callback]] = {phase: [] for phase in PHASES}
 
     @property
     def available(self) -> bool:
@@ -45,33 +67,72 @@ class ShutdownCallables(metaclass=ShutdownCallablesMeta):
             yield None
         finally:
             self._schedule = None
-            callbacks = self._callbacks
-            self._callbacks.clear()
-
-            if not loop.is_closed() and callbacks:
-                loop.create_task(
-                    wait_with_care(
-                        *(attempt_await(callback(loop)) for callback in callbacks),
-                        ignore_cancelled=True,
-                    )
-                )
+            callbacks, self._callbacks = self._callbacks, {phase: [] for phase in PHASES}
+
+            if not loop.is_closed():
+                # Awaited here, so shutdown_asyncgens only returns once every phase is over
+                for phase in PHASES:
+                    if callbacks[phase]:
+                        await self._run_phase(phase, callbacks[phase], loop)
+
+    async def _run_phase(
+        self, phase: str, callbacks: T.List[_Callback], loop: AbstractEventLoop
+    ) -> None:
+        budget = self.budgets[phase]
+        tasks: T.List["Future[None]"] = [
+            loop.create_task(_call(callback, loop)) for callback in callbacks
+        ]
+        done, pending = await wait(tasks, timeout=budget)
+
+        for fut in done:
+            _check(fut, loop, True, False)
+
+        if pending:
+            # Overrun, don't hold the next phases back
+            for fut in pending:
+                fut.cancel()
+
+            loop.call_exception_handler(
+                {
+                    "message": (
+                        f"{len(pending)} {phase} shutdown callbacks didn't finish"
+                        f" within the phase's {budget}s budget"
+                    ),
+                    "phase": phase,
+                    "pending": pending,
+                }
+            )
+
+            # Let them handle the cancellation, so they aren't destroyed pending with the loop
+            await wait(pending, timeout=_CANCEL_GRACE)
 
     def __call__(self) -> T.Awaitable[None]:
         self._schedule = self._schedule_at_loop_shutdown()
         return self._schedule.asend(None)
 
-    def append(self, callback: T.Callable[[AbstractEventLoop], T.Any]) -> None:
-        self._callbacks.append(callback)
+    def append(self, callback: _Callback, phase: str = CLOSE) -> None:
+        self._callbacks[phase].append(callback)
+
+
+def _check_phase(phase: str) -> None:
+    if phase not in PHASES:
+        raise ValueError(f"Unknown shutdown phase: {phase}")
 
 
 def at_loop_shutdown(
-    callback: T.Callable[[AbstractEventLoop], T.Any], *, loop: T.Optional[AbstractEventLoop] = None
+    callback: _Callback, *, loop: T.Optional[AbstractEventLoop] = None, phase: str = CLOSE
 ) -> None:
     """Allows scheduling a callback to be called during event loop shutdown logic.
 
+    Shutdown runs in phases: STOP_INTAKE, DRAIN, FLUSH and then CLOSE. The callbacks of a phase
+    run concurrently, and the next phase starts once they are all done, or once the phase's
+    budget (see `set_shutdown_budget`) is over, in which case the late ones are cancelled and
+    reported to the loop exception handler.
+
     Args:
         callback: Callback function to be called while lopping is shutting down.
         loop: Aforementioned event loop.
+        phase: Shutdown phase in which to call the callback.
 
     .. Warning:
         This rely in the shutdown_asyncgens function being called after stopping the loop.
@@ -89,9 +150,42 @@ def at_loop_shutdown(
         # To avoid confusion it is best to only allow running loops to have at_stop callbacks.
         raise RuntimeError("Loop must be running to schedule a at_loop_exit callback")
 
+    _check_phase(phase)
+
     shutdown_callbacks = ShutdownCallables(loop=loop)
     if shutdown_callbacks.available:
-        shutdown_callbacks.append(callback)
+        shutdown_callbacks.append(callback, phase)
     else:
         # Loop already called `shutdown_asyncgens`, just execute callback
-        loop.create_task(wait_with_care(attempt_await(callback(loop)), ignore_cancelled=True))
+        loop.create_task(wait_with_care(_call(callback, loop), ignore_cancelled=True))
+
+
+def set_shutdown_budget(
+    phase: str, budget: T.Optional[float], *, loop: T.Optional[AbstractEventLoop] = None
+) -> None:
+    """Set the maximum time, in seconds, a shutdown phase may take. None means no limit.
+
+    The sum of the budgets bounds how long at_loop_shutdown callbacks can delay the loop
+    shutdown, keep it under the process termination grace period.
+
+    Args:
+        phase: One of STOP_INTAKE, DRAIN, FLUSH or CLOSE.
+        budget: Time, in seconds, after which the phase's remaining callbacks are cancelled.
+        loop: Event loop whose shutdown is configured, the running one by default.
+
+    """
+    _check_phase(phase)
+    if budget is not None and budget < 0:
+        raise ValueError("budget must not be negative")
+
+    ShutdownCallables(loop=loop or get_running_loop()).budgets[phase] = budget
+
+
+__all__ = (
+    "at_loop_shutdown",
+    "set_shutdown_budget",
+    "STOP_INTAKE",
+    "DRAIN",
+    "FLUSH",
+    "CLOSE",
+)
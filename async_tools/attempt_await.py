@@ -1,17 +1,47 @@
 # Internal
 import typing as T
-from asyncio import AbstractEventLoop, ensure_future, get_running_loop
+from types import CoroutineType, GeneratorType, coroutine
+from asyncio import AbstractEventLoop
+from inspect import isawaitable
 
 # Generic types
 K = T.TypeVar("K")
 
 
+@coroutine
+def _ready(value: K) -> T.Generator[T.Any, None, K]:
+    # Generator based awaitable, creating and finishing it is cheaper than a coroutine
+    return value
+    yield  # type: ignore  # pragma: no cover
+
+
+def maybe_await(maybe_awaitable: T.Union[T.Awaitable[K], K]) -> T.Awaitable[K]:
+    """Synchronous part of attempt_await, `await maybe_await(value)` works for any value.
+
+    Awaitables are returned as is, anything else is wrapped in an awaitable resolving to it
+    right away.
+    """
+    kind = type(maybe_awaitable)
+    if (
+        kind is CoroutineType
+        # Futures and other awaitable objects
+        or hasattr(kind, "__await__")
+        # Generator based coroutines
+        or (kind is GeneratorType and isawaitable(maybe_awaitable))
+    ):
+        return T.cast(T.Awaitable[K], maybe_awaitable)
+    return _ready(T.cast(K, maybe_awaitable))
+
+
 async def attempt_await(
     maybe_awaitable: T.Union[T.Awaitable[K], K], loop: T.Optional[AbstractEventLoop] = None
 ) -> K:
-    if loop is None:
-        loop = get_running_loop()
-    else:
+    """Await the given value if it is awaitable, otherwise just return it.
+
+    Awaitables are awaited directly, without wrapping them in a task. Coroutines therefore run
+    in the caller's context, contextvars they set remain set for the caller afterwards.
+    """
+    if loop is not None:
         # Internal
         from warnings import warn
 
@@ -20,14 +50,7 @@ async def attempt_await(
             DeprecationWarning,
         )
 
-    try:
-        result_fut = ensure_future(T.cast(T.Awaitable[K], maybe_awaitable), loop=loop)
-    except TypeError:
-        assert not isinstance(maybe_awaitable, T.Awaitable)
-        return maybe_awaitable  # Not an awaitable
-    else:
-        assert isinstance(maybe_awaitable, T.Awaitable)
-        return await result_fut
+    return await maybe_await(maybe_awaitable)
 
 
-__all__ = ("attempt_await",)
+__all__ = ("maybe_await", "attempt_await")
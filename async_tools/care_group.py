@@ -0,0 +1,158 @@
+# Internal
+import typing as T
+from types import TracebackType
+from asyncio import (
+    Future,
+    TimeoutError,
+    AbstractEventLoop,
+    shield,
+    wait_for,
+    iscoroutine,
+    ensure_future,
+)
+
+# Project
+from .loopable import Loopable
+from .wait_with_care import _check
+from .error_aggregator import ErrorAggregator
+
+# Generic types
+K = T.TypeVar("K")
+
+# Default time, in seconds, exiting a group waits for its cancelled members
+_DRAIN_TIMEOUT = 10.0
+
+
+class CareGroup(Loopable, T.AsyncContextManager["CareGroup"]):
+    """Long lived group of tasks, with the error handling of wait_with_care.
+
+    Tasks can be added at any time with `spawn`. Each member has a single done callback, which
+    removes it from the group and sends its `Exception`, if any, to the loop exception handler.
+    With `raise_first_error`, the first error cancels the other members instead, and is raised
+    by `join` or on exit. Cancelled members are ignored.
+
+    Exiting the group cancels the remaining members and waits for them to finish, for at most
+    `drain_timeout` seconds, so a stuck member can't hang the shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        drain_timeout: T.Optional[float] = _DRAIN_TIMEOUT,
+        raise_first_error: bool = False,
+        reporter: T.Optional[ErrorAggregator] = None,
+        loop: T.Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """CareGroup constructor.
+
+        Arguments:
+            drain_timeout: Maximum time, in seconds, to wait for cancelled members on exit. None
+                waits without limit.
+            raise_first_error: Cancel the group on the first member error and raise it.
+            reporter: Aggregate member errors instead of reporting them one by one.
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        self._idle: T.Optional["Future[None]"] = None
+        self._error: T.Optional[BaseException] = None
+        self._closed = False
+        self._members: T.Set["Future[T.Any]"] = set()
+        self._drain_timeout = drain_timeout
+        self._reporter = reporter
+        self._raise_first_error = raise_first_error
+
+    def __len__(self) -> int:
+        """Number of members still running."""
+        return len(self._members)
+
+    def spawn(self, awaitable: T.Awaitable[K]) -> "Future[K]":
+        """Add an awaitable to the group, scheduling it as a task if needed."""
+        if self._closed:
+            if iscoroutine(awaitable):
+                # Prevent the never awaited warning, it was rejected rather than forgotten
+                awaitable.close()
+            raise RuntimeError("CareGroup is closed")
+
+        fut = ensure_future(awaitable, loop=self._loop)
+        self._members.add(fut)
+        fut.add_done_callback(self._on_done)
+        return fut
+
+    def _on_done(self, fut: "Future[T.Any]") -> None:
+        members = self._members
+        members.discard(fut)
+
+        try:
+            _check(fut, self._loop, True, self._raise_first_error, self._reporter)
+        except BaseException as exc:
+            if self._error is None:
+                self._error = exc
+                self.cancel()
+
+        if not members and self._idle is not None:
+            if not self._idle.done():
+                self._idle.set_result(None)
+            self._idle = None
+
+    def _raise(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def cancel(self) -> None:
+        """Cancel every member."""
+        for fut in self._members:
+            fut.cancel()
+
+    async def _drained(self) -> None:
+        while self._members:
+            if self._idle is None or self._idle.done():
+                self._idle = self._loop.create_future()
+            await shield(self._idle)
+
+    async def join(self) -> None:
+        """Wait until the group has no member left, including ones spawned meanwhile."""
+        await self._drained()
+        self._raise()
+
+    async def aclose(self) -> None:
+        """Stop accepting members, cancel the remaining ones and wait for them to finish."""
+        self._closed = True
+        self.cancel()
+
+        try:
+            await wait_for(self._drained(), self._drain_timeout)
+        except TimeoutError:
+            self._loop.call_exception_handler(
+                {
+                    "message": f"{len(self._members)} CareGroup members didn't finish in time",
+                    "group": self,
+                }
+            )
+
+        self._raise()
+
+    async def __aenter__(self) -> "CareGroup":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        try:
+            await self.aclose()
+        except Exception as exc:
+            if exc_type is None:
+                raise
+
+            # Don't mask the exception leaving the block
+            self._loop.call_exception_handler(
+                {"message": "Exception was raised by a CareGroup member", "exception": exc}
+            )
+
+
+__all__ = ("CareGroup",)
@@ -3,7 +3,7 @@ import typing as T
 
 # External
 # Generic types
-from async_tools import attempt_await
+from async_tools import maybe_await
 
 K = T.TypeVar("K")
 
@@ -30,7 +30,7 @@ class AsyncGeneratorCloseContext(T.AsyncContextManager[K]):
     async def __aexit__(self, _: T.Any, __: T.Any, ___: T.Any) -> T.Literal[False]:
         aclose = getattr(self._aiter, "aclose", None)
         if callable(aclose):
-            await attempt_await(aclose())
+            await maybe_await(aclose())
         return False
 
 
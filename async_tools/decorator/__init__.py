@@ -1,2 +1,3 @@
 # Project
 from .blocking import thread, process
+from .shared_cache import SharedResultCache
@@ -0,0 +1,24 @@
+# Internal
+import os
+import sys
+
+
+def gil_enabled() -> bool:
+    """Whether the running interpreter is currently holding a GIL.
+
+    Free-threaded builds (3.13t+) may still re-enable the GIL at runtime, for example when importing
+    an extension module that doesn't declare support for running without it, so this is checked on
+    each call instead of being cached.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else bool(is_gil_enabled())
+
+
+def cpu_workers() -> int:
+    """Number of CPUs available to this process, used to size CPU-bound pools."""
+    process_cpu_count = getattr(os, "process_cpu_count", None)
+    count = process_cpu_count() if callable(process_cpu_count) else os.cpu_count()
+    return count or 1
+
+
+__all__ = ("gil_enabled", "cpu_workers")
@@ -10,13 +10,18 @@ See original licenses in:
 import typing as T
 from sys import version_info
 from asyncio import get_running_loop
+from weakref import WeakSet
 from functools import wraps, partial
+from threading import Lock
 from concurrent.futures import BrokenExecutor
 from concurrent.futures.thread import ThreadPoolExecutor
 from concurrent.futures.process import ProcessPoolExecutor
 
 # Project
+from .shared_cache import SharedResultCache
+from ._free_threading import cpu_workers, gil_enabled
 from ._from_coroutine import _from_coroutine
+from ..drain_executors import drain_executor
 from ..at_loop_shutdown import at_loop_shutdown
 
 # Generic types
@@ -24,6 +29,11 @@ K = T.TypeVar("K")
 L = T.TypeVar("L", ThreadPoolExecutor, ProcessPoolExecutor)
 M = T.TypeVar("M", covariant=True)
 
+_MISSING = object()
+
+# Deadline, in seconds, for in-flight work of the decorators' executors on loop shutdown
+_SHUTDOWN_DRAIN_TIMEOUT = 10.0
+
 
 class DecoratorProtocol(T.Protocol[L, M]):
     __decorator__: "_BlockingDecorator[L]"
@@ -33,9 +43,23 @@ class DecoratorProtocol(T.Protocol[L, M]):
 
 
 class _BlockingDecorator(T.Generic[L]):
-    def __init__(self, cls: T.Type[L], executor: T.Optional[T.Union[int, L]] = None):
+    # Decorators currently owning an executor they created, for drain_executors
+    OWNERS: "WeakSet[_BlockingDecorator[T.Any]]" = WeakSet()
+
+    def __init__(
+        self,
+        cls: T.Type[L],
+        executor: T.Optional[T.Union[int, L]] = None,
+        *,
+        cache: T.Optional[SharedResultCache] = None,
+    ):
+        # Guards the lazily created executor. Without a GIL, concurrent first calls from different
+        # threads would otherwise race to create (and leak) more than one executor.
+        self._lock = Lock()
         self._managed = False
+        self._unmanaged = False
         self._workers: T.Optional[int] = None
+        self._cache = cache
         self._executor: T.Optional[L] = None
         self._external = False
         self._executor_cls: T.Type[L] = cls
@@ -47,67 +71,164 @@ class _BlockingDecorator(T.Generic[L]):
             self._executor = executor
         elif executor is not None:
             raise TypeError(f"Decorator executor must be a {cls.__qualname__}")
+        elif cls is ThreadPoolExecutor and not gil_enabled():
+            # Free-threaded build: threads run CPU-bound work in parallel, so use a dedicated pool
+            # sized to the available CPUs instead of the loop's I/O oriented default executor
+            self._workers = cpu_workers()
 
     @property
     def executor(self) -> T.Optional[L]:
-        if self._executor is None:
-            self._update_executor()
-            assert self._executor is not None
-        return self._executor
+        executor = self._executor
+        if executor is None:
+            executor = self._update_executor()
+        return executor
 
     @executor.setter
     def executor(self, executor: L) -> None:
-        if self._executor:
-            raise RuntimeError("Executor is already defined for this blocking decorator")
-
-        self._executor = executor
-
-    def _clear_executor(self, *, wait: bool = True) -> None:
-        if self._executor:
-            if version_info >= (3, 9):
-                self._executor.shutdown(wait=wait, cancel_futures=True)  # type: ignore
-            else:
-                self._executor.shutdown(wait=wait)
-            self._executor = None
+        with self._lock:
+            if self._executor:
+                raise RuntimeError("Executor is already defined for this blocking decorator")
 
-    def _update_executor(self) -> None:
-        self._clear_executor(wait=False)
-
-        self._executor = self._executor_cls(max_workers=self._workers)
+            self._executor = executor
 
-        if not self._managed:
-            at_loop_shutdown(lambda _: self._clear_executor())
+    @staticmethod
+    def _shutdown(executor: L, *, wait: bool) -> None:
+        if version_info >= (3, 9):
+            executor.shutdown(wait=wait, cancel_futures=True)  # type: ignore
+        else:
+            executor.shutdown(wait=wait)
+
+    def _pop_executor(self) -> T.Optional[L]:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self.OWNERS.discard(self)
+        return executor
+
+    async def _drain(self) -> None:
+        executor = self._pop_executor()
+        if executor:
+            # Without blocking the loop, the CLOSE phase budget applies too if it is shorter
+            await drain_executor(executor, timeout=_SHUTDOWN_DRAIN_TIMEOUT)
+
+    def _manage(self) -> None:
+        with self._lock:
+            if self._managed:
+                return
             self._managed = True
 
+        try:
+            at_loop_shutdown(lambda _: self._drain())
+        except BaseException:
+            self._managed = False
+            raise
+
+    def _update_executor(self, broken: T.Optional[L] = None) -> L:
+        with self._lock:
+            executor = self._executor
+            if executor is not None and executor is not broken:
+                # Another thread already created (or replaced the broken) executor
+                return executor
+
+            if self._cache is None:
+                self._executor = self._executor_cls(max_workers=self._workers)
+            else:
+                # Attach workers to the cache arena, so they can also read from it
+                initializer, initargs = self._cache.initializer
+                self._executor = self._executor_cls(
+                    max_workers=self._workers, initializer=initializer, initargs=initargs
+                )
+            new_executor = self._executor
+            self.OWNERS.add(self)
+
+        if executor:
+            self._shutdown(executor, wait=False)
+
+        try:
+            self._manage()
+        except RuntimeError:
+            # No running loop in this thread, registration is retried by _exec
+            self._unmanaged = True
+
+        return new_executor
+
+    def _cached_call(
+        self, func: T.Callable[..., K], args: T.Tuple[T.Any, ...], kwargs: T.Dict[str, T.Any]
+    ) -> K:
+        assert self._cache is not None
+        digest = self._cache.digest(func, args, kwargs)
+        if digest is None:
+            return func(*args, **kwargs)
+
+        result: T.Any = self._cache.get(digest, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            self._cache.put(digest, result)
+
+        return T.cast(K, result)
+
     async def _exec(self, func: T.Callable[..., T.Any], *args: T.Any, **kwargs: T.Any) -> K:
+        digest = None
+        if self._cache is not None:
+            # A cache hit skips the executor round trip entirely
+            if self._cache.name is None:
+                # Only the first call creates the arena, later ones don't take the cache lock
+                self._cache.open()
+            digest = self._cache.digest(func, args, kwargs)
+            if digest is not None:
+                cached = self._cache.get(digest, _MISSING)
+                if cached is not _MISSING:
+                    return T.cast(K, cached)
+
+        result: K = await self._run(func, *args, **kwargs)
+
+        if digest is not None:
+            assert self._cache is not None
+            self._cache.put(digest, result)
+
+        return result
+
+    async def _run(self, func: T.Callable[..., T.Any], *args: T.Any, **kwargs: T.Any) -> K:
         loop = get_running_loop()
         _break = False
         while True:
+            # Thread decorators without an explicit executor or worker count use the loop default
+            # executor, everything else runs in the decorator's own executor
+            executor = (
+                self._executor
+                if self._workers is None and self._executor_cls is ThreadPoolExecutor
+                else self.executor
+            )
+            if self._unmanaged:
+                self._unmanaged = False
+                self._manage()
             try:
                 if kwargs:
-                    return await loop.run_in_executor(
-                        self._executor, partial(func, *args, **kwargs)
-                    )
+                    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
 
-                return await loop.run_in_executor(self._executor, func, *args)
+                return await loop.run_in_executor(executor, func, *args)
             except BrokenExecutor as exc:
                 if _break:
                     raise exc
                 _break = True
                 loop.call_exception_handler({"message": "Executor broke", "exception": exc})
-                self._update_executor()
+                self._update_executor(executor)
                 continue
 
     def __call__(self, wrapped: T.Callable[..., K]) -> DecoratorProtocol[L, K]:
         @wraps(wrapped)
         def wrapper(*args: T.Any, **kwargs: T.Any) -> T.Union[T.Awaitable[K], K]:
             if not _from_coroutine():
-                return wrapped(*args, **kwargs)
+                if self._cache is None:
+                    return wrapped(*args, **kwargs)
+                return self._cached_call(wrapped, args, kwargs)
 
             # _exec is called with wrapper instead of wrapped, this is to appease pickle, as it
             # fails with UnpicklingError when _exec is called with wrapped
             return self._exec(wrapper, *args, **kwargs)
 
+        if self._cache is not None:
+            self._cache.bind_id(wrapped)
+
         setattr(wrapper, "__decorator__", self)
 
         return T.cast(DecoratorProtocol[L, K], wrapper)
@@ -136,6 +257,8 @@ def thread(
     If called from synchronous Python code, the function runs normally.
     However, if called from a coroutine, curio arranges for it to run
     in a thread.
+    On free-threaded builds a dedicated pool, sized to the available CPUs,
+    is used when no executor is given.
     """
     return (
         _BlockingDecorator(ThreadPoolExecutor)(func_or_executor)
@@ -151,13 +274,17 @@ def process(func_or_executor: T.Callable[..., K]) -> DecoratorProtocol[ProcessPo
 
 @T.overload
 def process(
-    func_or_executor: T.Union[ProcessPoolExecutor, int]
+    func_or_executor: T.Union[ProcessPoolExecutor, int, None] = None,
+    *,
+    cache: T.Optional[SharedResultCache] = None,
 ) -> T.Callable[[T.Callable[..., K]], DecoratorProtocol[ProcessPoolExecutor, K]]:
     ...
 
 
 def process(
-    func_or_executor: T.Union[T.Callable[..., K], ProcessPoolExecutor, int]
+    func_or_executor: T.Union[T.Callable[..., K], ProcessPoolExecutor, int, None] = None,
+    *,
+    cache: T.Optional[SharedResultCache] = None,
 ) -> T.Union[
     DecoratorProtocol[ProcessPoolExecutor, K],
     T.Callable[[T.Callable[..., K]], DecoratorProtocol[ProcessPoolExecutor, K]],
@@ -167,11 +294,13 @@ def process(
     If called from synchronous Python code, the function runs normally.
     However, if called from a coroutine, curio arranges for it to run
     in a thread.
+    Results of pure functions can be shared between the parent and the
+    workers through a :class:`SharedResultCache`.
     """
     return (
-        _BlockingDecorator(ProcessPoolExecutor)(func_or_executor)
+        _BlockingDecorator(ProcessPoolExecutor, cache=cache)(func_or_executor)
         if callable(func_or_executor)
-        else _BlockingDecorator(ProcessPoolExecutor, func_or_executor)
+        else _BlockingDecorator(ProcessPoolExecutor, func_or_executor, cache=cache)
     )
 
 
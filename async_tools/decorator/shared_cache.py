@@ -0,0 +1,242 @@
+# Internal
+import os
+import time
+import pickle
+import typing as T
+from zlib import crc32
+from array import array
+from struct import Struct
+from hashlib import blake2b
+from weakref import finalize
+from threading import Lock
+from multiprocessing import shared_memory
+
+# Slot header: write sequence (odd while being written), key digest, payload length and payload
+# checksum. Only the parent writes to the arena, last accesses are kept outside of it
+_SLOT = Struct("<Q16sII")
+_SEQ = Struct("<Q")
+_EMPTY_DIGEST = bytes(16)
+
+# Arenas handed to worker processes by the pool initializer, keyed by cache id
+_ATTACHED: T.Dict[str, str] = {}
+
+# Generic types
+K = T.TypeVar("K")
+
+
+def _attach(cache_id: str, name: str) -> None:
+    """Executor initializer, exposes the parent's arena to the worker process."""
+    _ATTACHED[cache_id] = name
+
+
+def _release(shm: shared_memory.SharedMemory, owner_pid: int) -> None:
+    shm.close()
+    if os.getpid() == owner_pid:
+        shm.unlink()
+
+
+def _open_shared_memory(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+    except TypeError:
+        # Python < 3.13, workers share the parent's resource tracker, so the extra registration
+        # is harmless and the arena is still only unlinked by the parent
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedResultCache:
+    """Result cache for `process` decorated pure functions, shared by the parent and its workers.
+
+    Results are stored, pickled, in a fixed size :class:`multiprocessing.shared_memory.SharedMemory`
+    arena divided in equally sized slots. Entries are keyed by a hash of the pickled arguments and
+    evicted in least recently used order, as seen by the parent, among the `ways` slots a key can
+    map to. Results that don't fit in a slot are not cached.
+
+    The parent process is the only writer, it checks the cache before submitting a call to the
+    executor and stores the result afterwards. Workers of pools created by the decorator (or forked
+    after the arena was created) can read it, so nested calls are also served from it.
+
+    .. Warning:
+        Only use this with pure functions whose arguments and results are picklable. Arguments that
+        pickle differently while being equal (e.g. sets) result in different keys.
+
+    """
+
+    def __init__(self, size: int = 2**24, *, slot_size: int = 4096, ways: int = 8) -> None:
+        """SharedResultCache constructor.
+
+        Arguments:
+            size: Arena size in bytes.
+            slot_size: Size in bytes of each slot, bounding the size of a cacheable result.
+            ways: Number of slots a key can be stored in, eviction picks the least recently used.
+
+        """
+        if slot_size <= _SLOT.size:
+            raise ValueError(f"slot_size must be larger than {_SLOT.size} bytes")
+        if ways < 1:
+            raise ValueError("ways must be a positive integer")
+
+        sets = size // (slot_size * ways)
+        if sets < 1:
+            raise ValueError("size must fit at least ways * slot_size bytes")
+
+        self._id: T.Optional[str] = None
+        self._pid = os.getpid()
+        self._lock = Lock()
+        self._shm: T.Optional[shared_memory.SharedMemory] = None
+        # Last access (monotonic ns) of each slot, private to the process that created the arena
+        self._ticks: T.Optional["array[int]"] = None
+        self._sets = sets
+        self._ways = ways
+        self._owner = False
+        self._finalizer: T.Optional["finalize[T.Any, T.Any]"] = None
+        self._slot_size = slot_size
+
+    @property
+    def name(self) -> T.Optional[str]:
+        """Name of the shared memory arena, if it was already created or attached."""
+        return None if self._shm is None else self._shm.name
+
+    @property
+    def initializer(self) -> T.Tuple[T.Callable[[str, str], None], T.Tuple[str, str]]:
+        """Executor initializer and arguments that attach workers to this cache arena."""
+        return _attach, (self.bind_id(), self.open())
+
+    def bind_id(self, func: T.Optional[T.Callable[..., T.Any]] = None) -> str:
+        """Identify this cache by the first function it is bound to.
+
+        The identity must be the same across processes, so workers re-importing the decorated
+        function can find the arena handed to them by the executor initializer.
+        """
+        if self._id is None:
+            if func is None:
+                raise RuntimeError("SharedResultCache is not bound to any function")
+            self._id = f"{func.__module__}.{func.__qualname__}"
+        return self._id
+
+    def open(self) -> str:
+        """Create the arena if this process doesn't have access to one yet."""
+        with self._lock:
+            shm = self._buffer()
+            if shm is None:
+                shm = shared_memory.SharedMemory(
+                    create=True, size=self._sets * self._ways * self._slot_size
+                )
+                self._shm = shm
+                self._ticks = array("Q", bytes(8 * self._sets * self._ways))
+                self._pid = os.getpid()
+                self._owner = True
+                self._finalizer = finalize(self, _release, shm, self._pid)
+
+        return shm.name
+
+    def _buffer(self) -> T.Optional[shared_memory.SharedMemory]:
+        if self._shm is None and self._id in _ATTACHED:
+            self._shm = _open_shared_memory(_ATTACHED[self._id])
+            self._finalizer = finalize(self, _release, self._shm, -1)
+        return self._shm
+
+    def digest(
+        self, func: T.Callable[..., T.Any], args: T.Tuple[T.Any, ...], kwargs: T.Dict[str, T.Any]
+    ) -> T.Optional[bytes]:
+        """Key for a call, None when the arguments can't be pickled."""
+        try:
+            data = pickle.dumps(
+                (func.__module__, func.__qualname__, args, sorted(kwargs.items())),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:
+            return None
+
+        return blake2b(data, digest_size=16).digest()
+
+    def _offsets(self, digest: bytes) -> range:
+        start = (int.from_bytes(digest[:8], "little") % self._sets) * self._ways * self._slot_size
+        return range(start, start + self._ways * self._slot_size, self._slot_size)
+
+    def get(self, digest: bytes, default: K) -> T.Union[T.Any, K]:
+        """Cached result for digest, or default if it isn't available."""
+        shm = self._buffer()
+        if shm is None:
+            return default
+
+        buf = shm.buf
+        assert buf is not None
+        for offset in self._offsets(digest):
+            seq, key, length, checksum = _SLOT.unpack_from(buf, offset)
+            if seq & 1 or key != digest:
+                continue
+
+            start = offset + _SLOT.size
+            data = bytes(buf[start : start + length])
+            # Seqlock: discard reads that raced with the writer
+            if _SEQ.unpack_from(buf, offset)[0] != seq or crc32(data) != checksum:
+                return default
+
+            try:
+                value = pickle.loads(data)
+            except Exception:
+                return default
+
+            ticks = self._ticks
+            if ticks is not None:
+                ticks[offset // self._slot_size] = time.monotonic_ns()
+            return value
+
+        return default
+
+    def put(self, digest: bytes, value: T.Any) -> bool:
+        """Store a result, only the process that created the arena is allowed to write to it."""
+        if not self._owner or self._pid != os.getpid():
+            return False
+
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+
+        if len(data) > self._slot_size - _SLOT.size:
+            return False
+
+        with self._lock:
+            shm = self._shm
+            ticks = self._ticks
+            if shm is None or ticks is None:
+                return False
+
+            buf = shm.buf
+            assert buf is not None
+            target = -1
+            oldest = -1
+            for offset in self._offsets(digest):
+                _, key, _, _ = _SLOT.unpack_from(buf, offset)
+                tick = ticks[offset // self._slot_size]
+                if key == digest or key == _EMPTY_DIGEST:
+                    target = offset
+                    break
+                if oldest < 0 or tick < oldest:
+                    target, oldest = offset, tick
+
+            (seq,) = _SEQ.unpack_from(buf, target)
+            _SEQ.pack_into(buf, target, seq + 1)
+            start = target + _SLOT.size
+            buf[start : start + len(data)] = data
+            _SLOT.pack_into(buf, target, seq + 1, digest, len(data), crc32(data))
+            _SEQ.pack_into(buf, target, seq + 2)
+            ticks[target // self._slot_size] = time.monotonic_ns()
+
+        return True
+
+    def close(self) -> None:
+        """Detach from the arena, removing it if this process created it."""
+        with self._lock:
+            finalizer, self._finalizer = self._finalizer, None
+            self._shm = None
+            self._ticks = None
+            self._owner = False
+
+        if finalizer is not None:
+            finalizer()
+
+
+__all__ = ("SharedResultCache",)
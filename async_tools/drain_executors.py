@@ -0,0 +1,150 @@
+# Internal
+import typing as T
+from sys import version_info
+from queue import Empty
+from asyncio import (
+    Future,
+    TimeoutError,
+    CancelledError,
+    AbstractEventLoop,
+    gather,
+    shield,
+    wait_for,
+    get_running_loop,
+)
+from threading import Thread
+from concurrent.futures import Executor
+
+
+def _resolve(fut: "Future[None]", exc: T.Optional[BaseException]) -> None:
+    if fut.done():
+        return
+
+    if exc is None:
+        fut.set_result(None)
+    else:
+        fut.set_exception(exc)
+
+
+def _cancel_queued(executor: Executor) -> None:
+    # Backport of shutdown's cancel_futures for thread pools on Python 3.8
+    work_queue = getattr(executor, "_work_queue", None)
+    if work_queue is None:
+        return
+
+    while True:
+        try:
+            work_item = work_queue.get_nowait()
+        except Empty:
+            break
+
+        if work_item is not None:
+            work_item.future.cancel()
+
+
+def _join(executor: Executor, loop: AbstractEventLoop, fut: "Future[None]") -> None:
+    exc: T.Optional[BaseException] = None
+    try:
+        if version_info >= (3, 9):
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            _cancel_queued(executor)
+            executor.shutdown(wait=True)
+    except Exception as ex:
+        exc = ex
+
+    try:
+        loop.call_soon_threadsafe(_resolve, fut, exc)
+    except RuntimeError:
+        # Loop was closed in the meantime, nobody is left waiting for the result
+        pass
+
+
+async def drain_executor(executor: Executor, *, timeout: T.Optional[float] = None) -> bool:
+    """Shutdown an executor, waiting at most `timeout` seconds for its in-flight work.
+
+    Queued work items are cancelled (only for thread pools on Python 3.8) and the wait happens
+    in a helper thread, so the loop is never blocked. Workers still running at the deadline, or
+    when the drain is cancelled, are reported to the loop exception handler. Process workers are
+    terminated, thread workers can't be and are left running.
+
+    Returns:
+        Whether every worker finished in time.
+
+    """
+    loop = get_running_loop()
+    # Taken beforehand, shutdown drops the executor references to its workers
+    threads = list(getattr(executor, "_threads", ()))
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+
+    done = loop.create_future()
+    Thread(target=_join, args=(executor, loop, done), daemon=True).start()
+
+    try:
+        await wait_for(shield(done), timeout)
+    except (TimeoutError, CancelledError) as exc:
+        stragglers: T.List[T.Any] = [worker for worker in threads if worker.is_alive()]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                stragglers.append(process)
+
+        if stragglers:
+            loop.call_exception_handler(
+                {
+                    "message": f"{len(stragglers)} executor workers didn't finish in time",
+                    "executor": executor,
+                    "stragglers": stragglers,
+                }
+            )
+
+        if isinstance(exc, CancelledError):
+            raise
+
+        return not stragglers
+
+    return True
+
+
+async def _drain_default_executor(
+    loop: AbstractEventLoop, timeout: T.Optional[float] = None
+) -> bool:
+    default_executor: T.Optional[Executor] = getattr(loop, "_default_executor", None)
+    if default_executor is None:
+        return True
+
+    # Detach it, so the loop creates a new default executor when it is needed again
+    setattr(loop, "_default_executor", None)
+    return await drain_executor(default_executor, timeout=timeout)
+
+
+async def drain_executors(*, timeout: T.Optional[float] = None) -> bool:
+    """Drain the loop default executor and every executor created by the blocking decorators.
+
+    All executors are drained concurrently, see :func:`drain_executor`, sharing the same
+    deadline. The loop and the decorated functions create new executors when called again.
+
+    Returns:
+        Whether every worker finished in time.
+
+    """
+    # Project
+    from .decorator.blocking import _BlockingDecorator
+
+    loop = get_running_loop()
+    executors = [
+        executor
+        for executor in (
+            decorator._pop_executor() for decorator in list(_BlockingDecorator.OWNERS)
+        )
+        if executor is not None
+    ]
+
+    drained = await gather(
+        _drain_default_executor(loop, timeout),
+        *(drain_executor(executor, timeout=timeout) for executor in executors),
+    )
+    return all(drained)
+
+
+__all__ = ("drain_executor", "drain_executors")
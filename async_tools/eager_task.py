@@ -0,0 +1,72 @@
+# Internal
+import sys
+import typing as T
+from types import coroutine
+from asyncio import Task, Future, CancelledError, AbstractEventLoop, get_running_loop
+from contextvars import Context, copy_context
+
+# Generic types
+K = T.TypeVar("K")
+
+
+@coroutine
+def _resume(
+    coro: T.Coroutine[T.Any, T.Any, K], yielded: T.Any, context: Context
+) -> T.Generator[T.Any, T.Any, K]:
+    # Drive a coroutine that was already stepped once, forwarding what it yields to the task
+    while True:
+        try:
+            value = yield yielded
+        except GeneratorExit:
+            coro.close()
+            raise
+        except BaseException as exc:
+            step: T.Callable[..., T.Any] = coro.throw
+            arg: T.Any = exc
+        else:
+            step, arg = coro.send, value
+
+        try:
+            yielded = context.run(step, arg)
+        except StopIteration as stop:
+            return T.cast(K, stop.value)
+
+
+def eager_task(
+    coro: T.Coroutine[T.Any, T.Any, K], *, loop: T.Optional[AbstractEventLoop] = None
+) -> "Future[K]":
+    """Run a coroutine until its first suspension before scheduling it on the loop.
+
+    A coroutine that finishes without suspending never touches the loop, its result (or error)
+    is returned in an already done future. Otherwise a task is created to continue it. Python
+    3.12+ eager tasks are used when available, older versions step the coroutine once in a copy
+    of the current context, where `asyncio.current_task` is still the caller.
+    """
+    if loop is None:
+        loop = get_running_loop()
+
+    if sys.version_info >= (3, 12):
+        return Task(coro, loop=loop, eager_start=True)
+
+    context = copy_context()
+    try:
+        yielded = context.run(coro.send, None)
+    except StopIteration as stop:
+        fut: "Future[K]" = loop.create_future()
+        fut.set_result(stop.value)
+        return fut
+    except CancelledError:
+        fut = loop.create_future()
+        fut.cancel()
+        return fut
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except BaseException as exc:
+        fut = loop.create_future()
+        fut.set_exception(exc)
+        return fut
+
+    return loop.create_task(_resume(coro, yielded, context))
+
+
+__all__ = ("eager_task",)
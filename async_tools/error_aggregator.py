@@ -0,0 +1,127 @@
+# Internal
+import typing as T
+import builtins
+from asyncio import Handle, AbstractEventLoop
+
+# Project
+from .loopable import Loopable
+
+_ExceptionGroup = getattr(builtins, "ExceptionGroup", None)
+
+_Origin = T.Tuple[T.Type[BaseException], str, int]
+
+
+def _origin(exc: BaseException) -> _Origin:
+    tb = exc.__traceback__
+    if tb is None:
+        return type(exc), "<unknown>", 0
+
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return type(exc), tb.tb_frame.f_code.co_filename, tb.tb_lineno
+
+
+class ErrorAggregator(Loopable):
+    """Aggregate errors before sending them to the loop exception handler.
+
+    Errors are grouped by type and origin (the place they were raised from), keeping a count and
+    a few samples of each group, with no formatting done per error. A single report is sent to
+    the loop exception handler at most once every `interval` seconds, errors arriving in between
+    are added to the next one. The report's `exception` is an ExceptionGroup of the samples
+    (Python 3.11+, the first sample otherwise), and `errors` maps each group to its count. The
+    pending report is also flushed in the FLUSH phase of the loop shutdown (see
+    at_loop_shutdown), so the last errors aren't lost when the loop stops before the interval.
+
+    Pass it as `reporter` to wait_with_care, as_completed_with_care or CareGroup.
+    """
+
+    def __init__(
+        self,
+        *,
+        samples: int = 3,
+        interval: float = 1.0,
+        loop: T.Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """ErrorAggregator constructor.
+
+        Arguments:
+            samples: Number of errors kept, for their traceback, in each group.
+            interval: Minimum time, in seconds, between two reports.
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        if samples < 1:
+            raise ValueError("samples must be a positive integer")
+        if interval < 0:
+            raise ValueError("interval must not be negative")
+
+        self._last = float("-inf")
+        self._managed = False
+        self._counts: T.Dict[_Origin, int] = {}
+        self._handle: T.Optional[Handle] = None
+        self._samples: T.Dict[_Origin, T.List[BaseException]] = {}
+        self._interval = interval
+        self._max_samples = samples
+
+    def add(self, exc: BaseException) -> None:
+        """Add an error to the next report."""
+        origin = _origin(exc)
+        count = self._counts.get(origin, 0)
+        self._counts[origin] = count + 1
+        if count < self._max_samples:
+            self._samples.setdefault(origin, []).append(exc)
+
+        if self._handle is None:
+            if not self._managed and self._loop.is_running():
+                self._manage()
+
+            # Errors raised in the same loop iteration always end up in the same report
+            delay = self._last + self._interval - self._loop.time()
+            self._handle = (
+                self._loop.call_later(delay, self.flush)
+                if delay > 0
+                else self._loop.call_soon(self.flush)
+            )
+
+    def _manage(self) -> None:
+        # Project
+        from .at_loop_shutdown import FLUSH, at_loop_shutdown
+
+        at_loop_shutdown(lambda _: self.flush(), loop=self._loop, phase=FLUSH)
+        self._managed = True
+
+    def flush(self) -> None:
+        """Send the pending report now, if there is one."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if not self._counts:
+            return
+
+        counts, self._counts = self._counts, {}
+        samples, self._samples = self._samples, {}
+        self._last = self._loop.time()
+
+        total = sum(counts.values())
+        lines = [f"{total} exceptions were raised while waiting, in {len(counts)} groups:"]
+        for (exc_type, filename, lineno), count in sorted(
+            counts.items(), key=lambda item: item[1], reverse=True
+        ):
+            lines.append(f"    {count}x {exc_type.__qualname__} raised at {filename}:{lineno}")
+        message = "\n".join(lines)
+
+        errors = [exc for group in samples.values() for exc in group]
+        if _ExceptionGroup is not None and all(isinstance(exc, Exception) for exc in errors):
+            exception: BaseException = _ExceptionGroup(message, errors)
+        else:
+            exception = errors[0]
+
+        self._loop.call_exception_handler(
+            {"message": message, "exception": exception, "errors": counts}
+        )
+
+
+__all__ = ("ErrorAggregator",)
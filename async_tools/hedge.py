@@ -0,0 +1,134 @@
+# Internal
+import typing as T
+from bisect import insort, bisect_left
+from asyncio import FIRST_COMPLETED, Future, wait, gather, ensure_future, get_running_loop
+from collections import deque
+
+# Generic types
+K = T.TypeVar("K")
+
+
+class LatencyQuantile:
+    """Rolling quantile of the last `window` observed latencies, an adaptive delay for `hedge`."""
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        *,
+        window: int = 1024,
+        initial: float = 0.1,
+        min_samples: int = 16,
+    ) -> None:
+        """LatencyQuantile constructor.
+
+        Arguments:
+            quantile: Quantile of the observed latencies to use as delay, between 0 and 1.
+            window: Number of latest observations considered.
+            initial: Delay used until `min_samples` latencies were observed.
+            min_samples: Observations required before the quantile is used.
+
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError("quantile must be between 0 and 1")
+        if window < 1:
+            raise ValueError("window must be a positive integer")
+
+        self._order: T.Deque[float] = deque(maxlen=window)
+        self._sorted: T.List[float] = []
+        self._initial = initial
+        self._quantile = quantile
+        self._min_samples = min_samples
+
+    def __len__(self) -> int:
+        """Number of latencies in the window."""
+        return len(self._order)
+
+    def observe(self, latency: float) -> None:
+        """Add a latency, in seconds, to the window."""
+        order = self._order
+        if len(order) == order.maxlen:
+            oldest = order[0]
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        order.append(latency)
+        insort(self._sorted, latency)
+
+    @property
+    def value(self) -> float:
+        """Current quantile, in seconds."""
+        samples = self._sorted
+        if len(samples) < self._min_samples:
+            return self._initial
+        return samples[min(int(self._quantile * len(samples)), len(samples) - 1)]
+
+
+async def hedge(
+    factory: T.Callable[[], T.Awaitable[K]],
+    *,
+    delay: T.Union[float, LatencyQuantile],
+    max_attempts: int = 2,
+) -> K:
+    """Hedged request, start another attempt each time `delay` passes without a result.
+
+    The first successful attempt wins, the others are cancelled and awaited before returning. A
+    failed attempt starts the next one right away, and if every attempt fails the last error is
+    raised. With a :class:`LatencyQuantile` as delay, the time from the first attempt to the
+    result is added to it, so the delay follows the observed latency distribution.
+
+    Arguments:
+        factory: Called to start each attempt.
+        delay: Seconds to wait for a result before starting another attempt.
+        max_attempts: Maximum number of attempts started.
+
+    Returns:
+        Result of the first successful attempt.
+
+    """
+    if max_attempts < 1:
+        raise ValueError("max_attempts must be a positive integer")
+
+    loop = get_running_loop()
+    tracker = delay if isinstance(delay, LatencyQuantile) else None
+    attempts = 0
+    pending: T.Set["Future[K]"] = set()
+
+    def attempt() -> None:
+        nonlocal attempts
+        attempts += 1
+        pending.add(ensure_future(factory()))
+
+    started = loop.time()
+    attempt()
+    try:
+        while True:
+            timeout = None
+            if attempts < max_attempts:
+                timeout = tracker.value if tracker is not None else T.cast(float, delay)
+
+            done, pending = await wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            failed = None
+            for fut in done:
+                if fut.cancelled() or fut.exception() is not None:
+                    failed = fut
+                    continue
+
+                if tracker is not None:
+                    # Measured from the first attempt, a hedge winning only tells the primary
+                    # took at least this long, leaving it out would bias the quantile down
+                    tracker.observe(loop.time() - started)
+                return fut.result()
+
+            if attempts < max_attempts:
+                # Either the delay expired or an attempt failed, start a backup
+                attempt()
+            elif failed is not None and not pending:
+                # Every attempt failed, raise the last error
+                return failed.result()
+    finally:
+        for fut in pending:
+            fut.cancel()
+        if pending:
+            await gather(*pending, return_exceptions=True)
+
+
+__all__ = ("hedge", "LatencyQuantile")
@@ -1,4 +1,10 @@
 # Project
-from ._locks import ReadLock, WriteLock
+from ._locks import Permits, ReadLock, WriteLock, UpgradableReadLock
+from ._stats import ACQUIRED, RELEASED, CANCELLED, LockStats, LockHolder
+from ._policy import FIFO, PHASE_FAIR, READER_PREFERRING, WRITER_PREFERRING
 from ._protocol import LockProtocol
+from ._rcu_cell import RCUCell
+from ._broadcast import Latch, Barrier, BroadcastEvent
 from ._async_lock_stack import AsyncLockStack
+from ._async_file_lock_stack import AsyncFileLockStack
+from ._async_keyed_lock_stack import AsyncKeyedLockStack
@@ -0,0 +1,183 @@
+# Internal
+import os
+import typing as T
+from types import TracebackType
+from asyncio import Future, TimeoutError, AbstractEventLoop, shield, wait_for
+
+try:
+    # Internal
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+# Project
+from ._locks import ReadLock, WriteLock
+from ._policy import FIFO
+from ..loopable import Loopable
+from ._protocol import LockProtocol
+from ._async_lock_stack import AsyncLockStack
+
+
+class _FileLockContext(T.AsyncContextManager[None]):
+    __slots__ = ("_mode", "_stack", "_context", "_timeout")
+
+    def __init__(
+        self,
+        stack: "AsyncFileLockStack",
+        lock_type: T.Type[LockProtocol],
+        timeout: T.Optional[float] = None,
+    ) -> None:
+        self._mode = fcntl.LOCK_EX if lock_type is WriteLock else fcntl.LOCK_SH
+        self._stack = stack
+        self._context = stack._stack(lock_type, timeout=timeout)
+        self._timeout = timeout
+
+    async def __aenter__(self) -> None:
+        stack = self._stack
+        loop = stack._loop
+        deadline = None if self._timeout is None else loop.time() + self._timeout
+
+        await self._context.__aenter__()
+        stack._holders += 1
+        try:
+            await stack._lock(self._mode, deadline)
+        except BaseException:
+            stack._holders -= 1
+            stack._maybe_unlock()
+            await self._context.__aexit__(None, None, None)
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        stack = self._stack
+        stack._holders -= 1
+        stack._maybe_unlock()
+        await self._context.__aexit__(exc_type, exc_value, traceback)
+
+
+class AsyncFileLockStack(Loopable):
+    """ReadLock/WriteLock shared by every process using the same lock file.
+
+    Coroutines of this process are coordinated by an :class:`AsyncLockStack`. Lock holders in this
+    process then share a single `fcntl.flock` on the file, shared while reading and exclusive while
+    writing, so readers of different processes run concurrently. When the file lock is contended it
+    is waited for in the loop's default executor, and in-process waiters join the pending request
+    instead of issuing their own.
+
+    The file lock is released as soon as this process holds no lock. Locks are tied to the open
+    file, so two stacks on the same path exclude each other even in the same process.
+    """
+
+    def __init__(
+        self, path: T.Union[str, "os.PathLike[str]"], *, policy: str = FIFO, **kwargs: T.Any
+    ) -> None:
+        """AsyncFileLockStack constructor.
+
+        Arguments:
+            path: Lock file, created if it doesn't exist.
+            policy: Fairness policy among this process' waiters, see :class:`AsyncLockStack`.
+            kwargs: Keyword parameters for super.
+
+        """
+        super().__init__(**kwargs)
+
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError("AsyncFileLockStack requires fcntl, which isn't available")
+
+        self._fd: T.Optional[int] = None
+        self._mode: T.Optional[int] = None
+        self._path = os.fspath(path)
+        self._stack = AsyncLockStack(policy=policy, loop=self._loop)
+        self._holders = 0
+        self._pending: T.Optional["Future[None]"] = None
+        self._contexts: T.Dict[T.Type[LockProtocol], _FileLockContext] = {}
+
+    @property
+    def path(self) -> str:
+        """Path of the lock file."""
+        return self._path
+
+    def _fileno(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o666)
+        return self._fd
+
+    async def _lock(self, mode: int, deadline: T.Optional[float]) -> None:
+        while self._mode != mode:
+            pending = self._pending
+            if pending is None:
+                fd = self._fileno()
+                try:
+                    # Fast path: the file lock is free, take it without leaving the loop
+                    fcntl.flock(fd, mode | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    pass
+                else:
+                    self._mode = mode
+                    return
+
+                pending = self._pending = T.cast(
+                    "Future[None]", self._loop.run_in_executor(None, fcntl.flock, fd, mode)
+                )
+                pending.add_done_callback(lambda fut: self._locked(fut, mode))
+
+            # Shielded, as the blocking request can't be cancelled and other waiters may need it
+            if deadline is None:
+                await shield(pending)
+            else:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    raise TimeoutError()
+                await wait_for(shield(pending), timeout)
+
+    def _locked(self, fut: "Future[None]", mode: int) -> None:
+        self._pending = None
+        if not fut.cancelled() and fut.exception() is None:
+            self._mode = mode
+            self._maybe_unlock()
+
+    def _maybe_unlock(self) -> None:
+        if self._holders or self._pending is not None or self._mode is None:
+            return
+
+        assert self._fd is not None
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._mode = None
+
+    def close(self) -> None:
+        """Close the lock file, must only be called when no lock is held or waited for."""
+        if self._holders or self._pending is not None:
+            raise RuntimeError("AsyncFileLockStack is in use")
+
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+
+    def __call__(
+        self, lock_type: T.Type[LockProtocol], *, timeout: T.Optional[float] = None
+    ) -> T.AsyncContextManager[None]:
+        """Context manager holding a lock of the given type.
+
+        Arguments:
+            lock_type: ReadLock or WriteLock.
+            timeout: Maximum time, in seconds, to wait for the lock before raising
+                asyncio.TimeoutError. None waits forever.
+
+        """
+        if lock_type is not ReadLock and lock_type is not WriteLock:
+            raise ValueError("AsyncFileLockStack only supports ReadLock and WriteLock")
+
+        if timeout is not None:
+            return _FileLockContext(self, lock_type, timeout)
+
+        context = self._contexts.get(lock_type)
+        if context is None:
+            context = self._contexts[lock_type] = _FileLockContext(self, lock_type)
+        return context
+
+
+__all__ = ("AsyncFileLockStack",)
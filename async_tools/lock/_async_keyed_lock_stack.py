@@ -0,0 +1,271 @@
+# Internal
+import typing as T
+from types import TracebackType
+from asyncio import AbstractEventLoop
+
+# Project
+from ._locks import Permits, ReadLock, WriteLock
+from ._policy import FIFO, POLICIES
+from ..loopable import Loopable
+from ._protocol import LockProtocol
+from ._async_lock_stack import AsyncLockStack, _LockGroup
+
+# Generic types
+K = T.TypeVar("K", bound=T.Hashable)
+
+# Maximum number of idle stacks kept for reuse
+_FREE_STACKS = 64
+
+
+class _KeyedLockContext(T.AsyncContextManager[None]):
+    __slots__ = ("_key", "_lock", "_keyed", "_stack", "_context", "_timeout", "_priority")
+
+    def __init__(
+        self,
+        keyed: "AsyncKeyedLockStack[K]",
+        key: K,
+        lock: T.Union[T.Type[LockProtocol], LockProtocol],
+        timeout: T.Optional[float],
+        priority: float,
+    ) -> None:
+        self._key = key
+        self._lock = lock
+        self._keyed = keyed
+        self._stack: T.Optional[AsyncLockStack] = None
+        self._context: T.Optional[T.AsyncContextManager[None]] = None
+        self._timeout = timeout
+        self._priority = priority
+
+    async def __aenter__(self) -> None:
+        keyed = self._keyed
+        stacks = keyed._stacks
+        stack = stacks.get(self._key)
+        if stack is None:
+            stack = stacks[self._key] = keyed._new_stack()
+
+        context = stack(self._lock, timeout=self._timeout, priority=self._priority)
+        try:
+            await context.__aenter__()
+        except BaseException:
+            keyed._evict(self._key, stack)
+            raise
+
+        self._stack = stack
+        self._context = context
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        stack, context = self._stack, self._context
+        assert stack is not None and context is not None
+
+        self._stack = self._context = None
+        await context.__aexit__(exc_type, exc_value, traceback)
+        self._keyed._evict(self._key, stack)
+
+
+class _AtomicLockContext(T.AsyncContextManager[None]):
+    __slots__ = ("_held", "_locks", "_keyed", "_timeout")
+
+    def __init__(
+        self,
+        keyed: "AsyncKeyedLockStack[K]",
+        locks: T.Mapping[K, T.Union[T.Type[LockProtocol], LockProtocol]],
+        timeout: T.Optional[float],
+    ) -> None:
+        self._held: T.Optional[T.List[T.Tuple[K, AsyncLockStack, LockProtocol]]] = None
+        self._locks = locks
+        self._keyed = keyed
+        self._timeout = timeout
+
+    async def __aenter__(self) -> None:
+        keyed = self._keyed
+        held = keyed._members(self._locks)
+        try:
+            await _LockGroup.acquire(
+                [(stack, lock) for _, stack, lock in held], keyed._loop, self._timeout
+            )
+        except BaseException:
+            for key, stack, _ in held:
+                keyed._evict(key, stack)
+            raise
+
+        self._held = held
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        held, self._held = self._held, None
+        assert held is not None
+
+        for _, stack, lock in held:
+            stack._release(lock)
+        for key, stack, _ in held:
+            self._keyed._evict(key, stack)
+
+
+class AsyncKeyedLockStack(Loopable, T.Generic[K]):
+    """Independent AsyncLockStack per key, e.g. one read/write lock per user id or file path.
+
+    By default lock state is created on first use of a key and dropped as soon as it has no
+    holders or waiters left, so memory is bound to the number of keys in use. With `stripes`, keys
+    are instead hashed into a fixed number of pre-allocated stacks. Memory is then constant, at the
+    cost of unrelated keys sharing a stripe contending with each other.
+    """
+
+    def __init__(
+        self,
+        *,
+        stripes: T.Optional[int] = None,
+        policy: str = FIFO,
+        prioritized: bool = False,
+        aging: float = 1.0,
+        loop: T.Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """AsyncKeyedLockStack constructor.
+
+        Arguments:
+            stripes: Number of stacks keys are hashed into, None to have one stack per key.
+            policy: Fairness policy for each stack, see :class:`AsyncLockStack`.
+            prioritized: Order waiters by priority, see :class:`AsyncLockStack`.
+            aging: Seconds of waiting worth one priority level.
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        if policy not in POLICIES:
+            raise ValueError(f"Invalid lock policy: {policy}")
+        if stripes is not None and stripes < 1:
+            raise ValueError("stripes must be a positive integer")
+
+        self._free: T.List[AsyncLockStack] = []
+        self._aging = aging
+        self._policy = policy
+        self._prioritized = prioritized
+        self._stacks: T.Dict[K, AsyncLockStack] = {}
+        self._stripes = (
+            None
+            if stripes is None
+            else tuple(
+                AsyncLockStack(
+                    policy=policy, prioritized=prioritized, aging=aging, loop=self._loop
+                )
+                for _ in range(stripes)
+            )
+        )
+
+    def __len__(self) -> int:
+        """Number of stacks currently allocated."""
+        return len(self._stacks) if self._stripes is None else len(self._stripes)
+
+    def _new_stack(self) -> AsyncLockStack:
+        if self._free:
+            return self._free.pop()
+        return AsyncLockStack(
+            policy=self._policy, prioritized=self._prioritized, aging=self._aging, loop=self._loop
+        )
+
+    def _evict(self, key: K, stack: AsyncLockStack) -> None:
+        if stack.idle and self._stacks.get(key) is stack:
+            del self._stacks[key]
+            if len(self._free) < _FREE_STACKS:
+                # Recycle idle stacks, so short lived keys don't pay for building a new one
+                stack._phase = None
+                self._free.append(stack)
+
+    def _members(
+        self, locks: T.Mapping[K, T.Union[T.Type[LockProtocol], LockProtocol]]
+    ) -> T.List[T.Tuple[K, AsyncLockStack, LockProtocol]]:
+        members: T.Dict[AsyncLockStack, T.Tuple[K, LockProtocol]] = {}
+        for key, lock in locks.items():
+            stack = self._stack(key)
+            lock = lock() if isinstance(lock, type) else lock
+            if stack in members:
+                # Keys sharing a stripe, merge both locks into one
+                other = members[stack][1]
+                if {type(other), type(lock)} <= {ReadLock, WriteLock}:
+                    if isinstance(other, WriteLock):
+                        continue
+                elif (
+                    isinstance(lock, Permits)
+                    and isinstance(other, Permits)
+                    and type(other) is type(lock)
+                ):
+                    # Both weights are needed, may raise if they exceed the capacity together
+                    lock = type(lock)(other.weight + lock.weight)
+                else:
+                    raise ValueError(
+                        "Keys sharing a stripe can only mix ReadLock and WriteLock, or Permits"
+                        " of the same type"
+                    )
+            members[stack] = (key, lock)
+
+        return [(key, stack, lock) for stack, (key, lock) in members.items()]
+
+    def _stack(self, key: K) -> AsyncLockStack:
+        if self._stripes is not None:
+            return self._stripes[hash(key) % len(self._stripes)]
+
+        stack = self._stacks.get(key)
+        if stack is None:
+            stack = self._stacks[key] = self._new_stack()
+        return stack
+
+    def atomic(
+        self,
+        locks: T.Mapping[K, T.Union[T.Type[LockProtocol], LockProtocol]],
+        *,
+        timeout: T.Optional[float] = None,
+    ) -> T.AsyncContextManager[None]:
+        """Context manager holding the locks of several keys at once, e.g. both ends of a transfer.
+
+        The locks are acquired all or nothing, suspending at most once until all of them can be
+        granted together, so there is no lock ordering to get right. Requires the FIFO policy.
+
+        Arguments:
+            locks: Lock type, or lock instance, to acquire for each key.
+            timeout: Maximum time, in seconds, to wait for the locks before raising
+                asyncio.TimeoutError. None waits forever.
+
+        """
+        if self._policy != FIFO or self._prioritized:
+            raise ValueError("Atomic acquisition requires a FIFO AsyncKeyedLockStack")
+
+        return _AtomicLockContext(self, locks, timeout)
+
+    def upgrade(self, key: K, *, timeout: T.Optional[float] = None) -> T.AsyncContextManager[None]:
+        """Convert the UpgradableReadLock held for key to a WriteLock, see AsyncLockStack.upgrade."""
+        if self._stripes is not None:
+            return self._stripes[hash(key) % len(self._stripes)].upgrade(timeout=timeout)
+
+        stack = self._stacks.get(key)
+        if stack is None:
+            raise RuntimeError("UpgradableReadLock isn't held")
+        return stack.upgrade(timeout=timeout)
+
+    def __call__(
+        self,
+        key: K,
+        lock: T.Union[T.Type[LockProtocol], LockProtocol],
+        *,
+        timeout: T.Optional[float] = None,
+        priority: float = 0,
+    ) -> T.AsyncContextManager[None]:
+        if self._stripes is not None:
+            return self._stripes[hash(key) % len(self._stripes)](
+                lock, timeout=timeout, priority=priority
+            )
+
+        if priority and not self._prioritized:
+            raise ValueError("AsyncKeyedLockStack isn't prioritized")
+        return _KeyedLockContext(self, key, lock, timeout, priority)
+
+
+__all__ = ("AsyncKeyedLockStack",)
@@ -1,19 +1,266 @@
 # Internal
 import typing as T
-from asyncio import Future, AbstractEventLoop
+from types import TracebackType
+from asyncio import Task, Future, TimeoutError, AbstractEventLoop, current_task
+from itertools import count
 from collections import Counter
 
-# External
-from async_tools.context import asynccontextmanager
-
 # Project
+from ._locks import ReadLock, WriteLock, UpgradableReadLock
+from ._queue import _FifoQueue, _WaiterQueue, _PriorityQueue
+from ._stats import ACQUIRED, RELEASED, CANCELLED, LockHook, LockStats, LockHolder, _Recorder
+from ._policy import FIFO, POLICIES, PHASE_FAIR, READER_PREFERRING, WRITER_PREFERRING
 from ..loopable import Loopable
 from ._protocol import LockProtocol
 
 
+def _weight(lock: LockProtocol) -> int:
+    # Units of its type a lock takes from the vault, see Permits
+    return T.cast(int, getattr(lock, "weight", 1))
+
+
+def _expire(fut: "Future[None]") -> None:
+    if not fut.done():
+        fut.set_exception(TimeoutError())
+
+
+class _AsyncLockContext(T.AsyncContextManager[None]):
+    """Acquire and release a lock type from an AsyncLockStack.
+
+    It holds no per acquisition state, so a single instance is shared by every acquisition of the
+    same lock type in a stack.
+    """
+
+    __slots__ = ("_lock", "_stack", "_timeout", "_priority")
+
+    def __init__(
+        self,
+        stack: "AsyncLockStack",
+        lock: LockProtocol,
+        timeout: T.Optional[float] = None,
+        priority: float = 0,
+    ) -> None:
+        self._lock = lock
+        self._stack = stack
+        self._timeout = timeout
+        self._priority = priority
+
+    async def __aenter__(self) -> None:
+        if not self._stack._try_acquire(self._lock):
+            await self._stack._acquire(self._lock, self._timeout, self._priority)
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        self._stack._release(self._lock)
+
+
+class _InstrumentedLockContext(T.AsyncContextManager[None]):
+    """Acquire and release a lock type from an instrumented AsyncLockStack."""
+
+    __slots__ = ("_lock", "_task", "_since", "_stack", "_timeout", "_priority", "_lock_type")
+
+    def __init__(
+        self,
+        stack: "AsyncLockStack",
+        lock: LockProtocol,
+        timeout: T.Optional[float] = None,
+        priority: float = 0,
+    ) -> None:
+        self._lock = lock
+        self._task: T.Optional["Task[T.Any]"] = None
+        self._since = 0.0
+        self._stack = stack
+        self._timeout = timeout
+        self._priority = priority
+        self._lock_type = type(lock)
+
+    async def __aenter__(self) -> None:
+        stack = self._stack
+        lock = self._lock
+        lock_type = self._lock_type
+        recorder = stack._recorder(lock_type)
+        start = stack._loop.time()
+
+        wait = 0.0
+        if not stack._try_acquire(lock):
+            waiting = len(stack._locks.get(lock_type, ())) + 1
+            if waiting > recorder.max_waiting:
+                recorder.max_waiting = waiting
+
+            try:
+                await stack._acquire(lock, self._timeout, self._priority)
+            except BaseException:
+                recorder.cancelled += 1
+                stack._emit(CANCELLED, lock_type, stack._loop.time() - start)
+                raise
+
+            self._since = stack._loop.time()
+            wait = self._since - start
+            recorder.contended += 1
+            recorder.wait_total += wait
+            if wait > recorder.wait_max:
+                recorder.wait_max = wait
+        else:
+            self._since = start
+
+        recorder.acquisitions += 1
+        self._task = current_task()
+        stack._holders.add(self)
+        stack._emit(ACQUIRED, lock_type, wait)
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        stack = self._stack
+        lock_type = self._lock_type
+        recorder = stack._recorder(lock_type)
+        held = stack._loop.time() - self._since
+
+        stack._holders.discard(self)
+        stack._release(self._lock)
+
+        recorder.hold_total += held
+        if held > recorder.hold_max:
+            recorder.hold_max = held
+        stack._emit(RELEASED, lock_type, held)
+
+
+class _UpgradeContext(T.AsyncContextManager[None]):
+    """Convert the held UpgradableReadLock to a WriteLock, and back on exit."""
+
+    __slots__ = ("_stack", "_timeout")
+
+    def __init__(self, stack: "AsyncLockStack", timeout: T.Optional[float] = None) -> None:
+        self._stack = stack
+        self._timeout = timeout
+
+    async def __aenter__(self) -> None:
+        await self._stack._upgrade(self._timeout)
+
+    async def __aexit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        self._stack._downgrade()
+
+
+class _LockGroup:
+    """All or nothing acquisition of locks from several FIFO stacks.
+
+    A member is queued in each stack, all at once, so groups are ordered the same way in every
+    stack they share. Once at the head of a stack and grantable, a member keeps the head (blocking
+    the waiters behind it) until every member is, then all are granted together. The oldest group
+    waits only on older waiters and holders, so there is no deadlock.
+    """
+
+    __slots__ = ("_fut", "_ready", "_members")
+
+    def __init__(self, fut: "Future[None]") -> None:
+        self._fut = fut
+        self._ready: T.Set["AsyncLockStack"] = set()
+        self._members: T.List[T.Tuple["AsyncLockStack", LockProtocol, int]] = []
+
+    @staticmethod
+    async def acquire(
+        locks: T.Sequence[T.Tuple["AsyncLockStack", LockProtocol]],
+        loop: AbstractEventLoop,
+        timeout: T.Optional[float] = None,
+    ) -> None:
+        """Acquire every (stack, lock) pair, suspending at most once."""
+        if all(
+            not stack._locks and stack._upgrading is None and lock.can_acquire(stack._vault)
+            for stack, lock in locks
+        ):
+            for stack, lock in locks:
+                stack._try_acquire(lock)
+            return
+
+        fut = loop.create_future()
+        group = _LockGroup(fut)
+        for stack, lock in locks:
+            group._members.append((stack, lock, stack._enqueue(lock, fut)))
+            stack._groups[fut] = group
+        for stack, _ in locks:
+            if not fut.done():
+                stack._maybe_acquire()
+
+        handle = None if timeout is None else loop.call_later(timeout, _expire, fut)
+        try:
+            await fut
+        except BaseException:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                # Granted, but the waiter was cancelled before it could resume
+                for stack, lock in locks:
+                    stack._release(lock)
+            else:
+                fut.cancel()
+                for stack, lock, seq in group._members:
+                    stack._groups.pop(fut, None)
+                    stack._discard(type(lock), seq)
+            raise
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+    def ready(self, stack: "AsyncLockStack") -> bool:
+        """Member of stack reached its head grantable, grant the group if all members did."""
+        ready = self._ready
+        ready.add(stack)
+        if len(ready) < len(self._members):
+            return False
+
+        for member_stack, lock, _ in self._members:
+            if member_stack._upgrading is not None or not lock.can_acquire(member_stack._vault):
+                # Stopped being grantable since, its stack checks it again on the next release
+                ready.discard(member_stack)
+                return False
+
+        fut = self._fut
+        for member_stack, lock, seq in self._members:
+            del member_stack._groups[fut]
+            member_stack._take(lock, seq)
+        fut.set_result(None)
+
+        for member_stack, _, _ in self._members:
+            if member_stack is not stack and member_stack._locks:
+                # Waiters behind the members may be grantable now
+                member_stack._maybe_acquire()
+
+        return True
+
+
 class AsyncLockStack(Loopable):
     """A small asyncio framework for constructing locks.
 
+    Waiters are kept in one FIFO queue per lock type, and removed from it as soon as they give up.
+    The fairness policy decides which queue is served next, and a waiter that can't acquire its
+    lock stops the acquisition pass, so waiters of the same type are always granted in order:
+        FIFO: Strict arrival order across all lock types (default).
+        READER_PREFERRING: ReadLock waiters go first, writers only run when no reader is waiting.
+        WRITER_PREFERRING: WriteLock waiters go first, new readers wait for every queued writer.
+        PHASE_FAIR: Lock types alternate, all readers waiting when a writer releases are admitted
+            together and readers arriving after a writer queued wait for it.
+
+    A `prioritized` stack orders waiters by the `priority` given on acquisition instead of arrival.
+    To prevent starvation every `aging` seconds spent waiting are worth one priority level.
+
+    The holder of an UpgradableReadLock can convert it to a WriteLock with `upgrade`. Once an
+    upgrade is requested no new lock is granted, and it completes as soon as the current readers
+    release, without any other writer getting in between.
+
+    With `instrument` enabled, per lock type contention statistics are kept (see `stats` and
+    `longest_holder`), and `hook` is called with every ACQUIRED, RELEASED and CANCELLED event.
+    Uninstrumented stacks pay nothing for it.
+
     This is a modified version of the following:
         link: https://github.com/michalc/fifolock/blob/ce7a2d72cc84c4114a68b3b79176367db1d866cd/fifolock.py
         author: Michal Charemza <https://github.com/michalc>
@@ -21,35 +268,343 @@ class AsyncLockStack(Loopable):
 
     """
 
-    def __init__(self, *, loop: T.Optional[AbstractEventLoop] = None) -> None:
+    def __init__(
+        self,
+        *,
+        loop: T.Optional[AbstractEventLoop] = None,
+        hook: T.Optional[LockHook] = None,
+        policy: str = FIFO,
+        instrument: bool = False,
+        prioritized: bool = False,
+        aging: float = 1.0,
+    ) -> None:
         super().__init__(loop=loop)
 
+        if policy not in POLICIES:
+            raise ValueError(f"Invalid lock policy: {policy}")
+        if aging <= 0:
+            raise ValueError("aging must be a positive number")
+
+        self._seq = count()
+        self._phase: T.Optional[T.Type[LockProtocol]] = None
+        self._batch: T.Optional[T.Type[LockProtocol]] = None
         self._vault: T.Counter[T.Type[LockProtocol]] = Counter()
-        self._locks: T.List[T.Tuple["Future[None]", LockProtocol]] = []
+        self._aging = aging
+        self._locks: T.Dict[T.Type[LockProtocol], _WaiterQueue] = {}
+        self._policy = policy
+        self._prioritized = prioritized
+        self._groups: T.Dict["Future[None]", _LockGroup] = {}
+        self._upgrading: T.Optional["Future[None]"] = None
+        self._contexts: T.Dict[T.Type[LockProtocol], _AsyncLockContext] = {}
+
+        # Instrumentation
+        self._hook = hook
+        self._stats: T.Optional[T.Dict[T.Type[LockProtocol], _Recorder]] = (
+            {} if instrument or hook is not None else None
+        )
+        self._holders: T.Set[_InstrumentedLockContext] = set()
+
+    def _oldest(self, lock_types: T.Iterable[T.Type[LockProtocol]]) -> T.Type[LockProtocol]:
+        locks = self._locks
+        return min(lock_types, key=lambda lock_type: locks[lock_type].order())
+
+    def _next(self) -> T.Optional[T.Type[LockProtocol]]:
+        locks = self._locks
+        if not locks:
+            return None
+
+        policy = self._policy
+        if policy == FIFO or len(locks) == 1:
+            return self._oldest(locks)
+        elif policy == READER_PREFERRING:
+            return ReadLock if ReadLock in locks else self._oldest(locks)
+        elif policy == WRITER_PREFERRING:
+            return WriteLock if WriteLock in locks else self._oldest(locks)
+
+        assert policy == PHASE_FAIR
+        if self._batch in locks:
+            # Keep admitting the phase that started in this acquisition pass
+            return self._batch
+
+        # Give the turn to a lock type other than the one from the current phase
+        return self._oldest(lock_type for lock_type in locks if lock_type is not self._phase)
 
     def _maybe_acquire(self) -> None:
-        while self._locks:
-            fut, lock = self._locks.pop()
-            if fut.cancelled():
-                continue
+        if self._upgrading is not None:
+            # A pending upgrade only waits for the current readers
+            return
 
-            if not lock.can_acquire(self._vault):
-                self._locks.append((fut, lock))
-                break
+        locks = self._locks
+        try:
+            while True:
+                lock_type = self._next()
+                if lock_type is None:
+                    break
 
-            self._vault[type(lock)] += 1
-            fut.set_result(None)
+                queue = locks[lock_type]
+                fut, lock = queue.head()
+                if not (fut.done() or lock.can_acquire(self._vault)):
+                    break
+
+                if self._groups and fut in self._groups and not fut.done():
+                    # Member of an all or nothing acquisition, it holds the head until its group
+                    # is grantable in every stack
+                    if self._groups[fut].ready(self):
+                        continue
+                    break
+
+                queue.pop_head()
+                if not queue:
+                    del locks[lock_type]
+
+                if fut.done():
+                    # Gave up, but its task didn't resume yet to remove it
+                    continue
+
+                if self._phase is not lock_type:
+                    self._phase = self._batch = lock_type
+                self._vault[lock_type] += _weight(lock)
+                fut.set_result(None)
+        finally:
+            self._batch = None
+
+    def _try_acquire(self, lock: LockProtocol) -> bool:
+        if self._locks or self._upgrading is not None or not lock.can_acquire(self._vault):
+            return False
+
+        # Fast path: nobody is waiting, grant synchronously without creating a future
+        lock_type = type(lock)
+        self._phase = lock_type
+        self._vault[lock_type] += _weight(lock)
+        return True
+
+    def _enqueue(self, lock: LockProtocol, fut: "Future[None]", priority: float = 0) -> int:
+        seq = next(self._seq)
+        lock_type = type(lock)
+        queue = self._locks.get(lock_type)
+        if queue is None:
+            queue = self._locks[lock_type] = (
+                _PriorityQueue(self._aging) if self._prioritized else _FifoQueue()
+            )
+        queue.push(seq, (fut, lock), priority, self._loop.time())
+        return seq
 
-    @asynccontextmanager
-    async def __call__(self, lock_type: T.Type[LockProtocol]) -> T.AsyncGenerator[None, None]:
+    async def _acquire(
+        self, lock: LockProtocol, timeout: T.Optional[float] = None, priority: float = 0
+    ) -> None:
+        lock_type = type(lock)
         fut = self._loop.create_future()
-        lock = lock_type()
-        self._locks.append((fut, lock))
+        seq = self._enqueue(lock, fut, priority)
         self._maybe_acquire()
+
+        handle = None if timeout is None else self._loop.call_later(timeout, _expire, fut)
         try:
             await fut
-            yield
+        except BaseException:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                # Lock was granted, but the waiter was cancelled before it could resume
+                self._release(lock)
+            else:
+                fut.cancel()
+                self._discard(lock_type, seq)
+            raise
         finally:
-            if fut.done() and not fut.cancelled():
-                self._vault[type(lock)] -= 1
+            if handle is not None:
+                handle.cancel()
+
+    def _take(self, lock: LockProtocol, seq: int) -> None:
+        # Grant a queued waiter outside of an acquisition pass
+        locks = self._locks
+        lock_type = type(lock)
+        queue = locks[lock_type]
+        queue.discard(seq)
+        if not queue:
+            del locks[lock_type]
+
+        self._phase = lock_type
+        self._vault[lock_type] += _weight(lock)
+
+    def _discard(self, lock_type: T.Type[LockProtocol], seq: int) -> None:
+        # Drop a waiter that gave up, instead of leaving it for an acquisition pass to skip
+        locks = self._locks
+        queue = locks.get(lock_type)
+        if queue is None or not queue.discard(seq):
+            return
+
+        if not queue:
+            del locks[lock_type]
+        if locks:
+            # It may have been blocking the ones behind it
+            self._maybe_acquire()
+
+    def _release(self, lock: LockProtocol) -> None:
+        vault = self._vault
+        lock_type = type(lock)
+        vault[lock_type] -= _weight(lock)
+        if not vault[lock_type]:
+            # Keep the vault empty when nothing is held, see `idle`
+            del vault[lock_type]
+        if self._upgrading is not None:
+            self._maybe_upgrade()
+        elif self._locks:
+            self._maybe_acquire()
+
+    def _convert(self, source: T.Type[LockProtocol], target: T.Type[LockProtocol]) -> None:
+        vault = self._vault
+        vault[source] -= 1
+        if not vault[source]:
+            del vault[source]
+        vault[target] += 1
+        self._phase = target
+
+    def _maybe_upgrade(self) -> None:
+        fut = self._upgrading
+        if fut is None or self._vault[ReadLock]:
+            return
+
+        self._upgrading = None
+        if fut.done():
+            # Gave up, but its task didn't resume yet
+            if self._locks:
                 self._maybe_acquire()
+        else:
+            self._convert(UpgradableReadLock, WriteLock)
+            fut.set_result(None)
+
+    async def _upgrade(self, timeout: T.Optional[float] = None) -> None:
+        vault = self._vault
+        if not vault[UpgradableReadLock]:
+            raise RuntimeError("UpgradableReadLock isn't held")
+        if self._upgrading is not None or vault[WriteLock]:
+            raise RuntimeError("UpgradableReadLock is already being upgraded")
+
+        if not vault[ReadLock]:
+            self._convert(UpgradableReadLock, WriteLock)
+            return
+
+        fut = self._upgrading = self._loop.create_future()
+        handle = None if timeout is None else self._loop.call_later(timeout, _expire, fut)
+        try:
+            await fut
+        except BaseException:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                # Upgraded, but the waiter was cancelled before it could resume
+                self._downgrade()
+            else:
+                fut.cancel()
+                if self._upgrading is fut:
+                    self._upgrading = None
+                    if self._locks:
+                        self._maybe_acquire()
+            raise
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+    def _downgrade(self) -> None:
+        self._convert(WriteLock, UpgradableReadLock)
+        if self._locks:
+            self._maybe_acquire()
+
+    @property
+    def idle(self) -> bool:
+        """Whether no lock is held or waited for."""
+        return not (self._vault or self._locks)
+
+    def _context(self, lock_type: T.Type[LockProtocol]) -> _AsyncLockContext:
+        # Only called on a cache miss, the hot path does the single lookup itself
+        context = self._contexts[lock_type] = _AsyncLockContext(self, lock_type())
+        return context
+
+    def _recorder(self, lock_type: T.Type[LockProtocol]) -> _Recorder:
+        assert self._stats is not None
+        recorder = self._stats.get(lock_type)
+        if recorder is None:
+            recorder = self._stats[lock_type] = _Recorder()
+        return recorder
+
+    def _emit(self, event: str, lock_type: T.Type[LockProtocol], duration: float) -> None:
+        if self._hook is None:
+            return
+
+        try:
+            self._hook(event, lock_type, duration)
+        except Exception as exc:
+            self._loop.call_exception_handler(
+                {"message": f"Exception was raised by lock hook {self._hook!r}", "exception": exc}
+            )
+
+    def stats(self) -> T.Dict[T.Type[LockProtocol], LockStats]:
+        """Snapshot of the contention statistics of each lock type used in this stack."""
+        if self._stats is None:
+            raise RuntimeError("AsyncLockStack isn't instrumented")
+
+        return {
+            lock_type: recorder.snapshot(
+                self._vault[lock_type], len(self._locks.get(lock_type, ()))
+            )
+            for lock_type, recorder in self._stats.items()
+        }
+
+    def longest_holder(self) -> T.Optional[LockHolder]:
+        """Snapshot of the lock that has been held the longest, if any."""
+        if self._stats is None:
+            raise RuntimeError("AsyncLockStack isn't instrumented")
+
+        if not self._holders:
+            return None
+
+        holder = min(self._holders, key=lambda context: context._since)
+        return LockHolder(
+            lock_type=holder._lock_type,
+            task=holder._task,
+            since=holder._since,
+            held=self._loop.time() - holder._since,
+        )
+
+    def upgrade(self, *, timeout: T.Optional[float] = None) -> T.AsyncContextManager[None]:
+        """Context manager converting the held UpgradableReadLock to a WriteLock while entered.
+
+        Must only be used by the holder of the UpgradableReadLock.
+
+        Arguments:
+            timeout: Maximum time, in seconds, to wait for readers to release before raising
+                asyncio.TimeoutError. None waits forever.
+
+        """
+        return _UpgradeContext(self, timeout)
+
+    def __call__(
+        self,
+        lock: T.Union[T.Type[LockProtocol], LockProtocol],
+        *,
+        timeout: T.Optional[float] = None,
+        priority: float = 0,
+    ) -> T.AsyncContextManager[None]:
+        """Context manager holding a lock of the given type.
+
+        Arguments:
+            lock: Lock type to acquire, or a lock instance for parametrized locks such as Permits.
+            timeout: Maximum time, in seconds, to wait for the lock before raising
+                asyncio.TimeoutError. None waits forever.
+            priority: Waiters with a higher priority are granted first, requires a prioritized
+                stack.
+
+        """
+        if priority and not self._prioritized:
+            raise ValueError("AsyncLockStack isn't prioritized")
+
+        if isinstance(lock, type):
+            context = self._contexts.get(lock)
+            if context is None:
+                context = self._context(lock)
+
+            if self._stats is None and timeout is None and not priority:
+                return context
+
+            lock = context._lock
+
+        if self._stats is not None:
+            return _InstrumentedLockContext(self, lock, timeout, priority)
+
+        return _AsyncLockContext(self, lock, timeout, priority)
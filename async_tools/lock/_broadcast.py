@@ -0,0 +1,185 @@
+# Internal
+import typing as T
+from asyncio import Future, AbstractEventLoop
+
+# Project
+from ..loopable import Loopable
+
+
+class _Generation(Future):  # type: ignore[type-arg]
+    """Future shared by the waiters of a generation, cancelling a waiter doesn't cancel it.
+
+    Task.cancel() cancels the future its task is waiting on. Here it wakes the generation
+    instead and reports the future as not cancellable, so the Task raises CancelledError in the
+    cancelled waiter only while the other waiters resume and wait on a new generation future.
+    """
+
+    def cancel(self, *args: T.Any, **kwargs: T.Any) -> bool:
+        if not self.done():
+            self.set_result(None)
+        return False
+
+
+class _Broadcast(Loopable):
+    """Waiters of a generation share a single future, released with one set_result."""
+
+    def __init__(self, *, loop: T.Optional[AbstractEventLoop] = None) -> None:
+        super().__init__(loop=loop)
+
+        self._fut: T.Optional["Future[None]"] = None
+        self._generation = 0
+
+    def _release(self) -> None:
+        self._generation += 1
+        fut, self._fut = self._fut, None
+        if fut is not None and not fut.done():
+            fut.set_result(None)
+
+    async def _wait(self) -> None:
+        generation = self._generation
+        while self._generation == generation:
+            fut = self._fut
+            if fut is None:
+                fut = self._fut = _Generation(loop=self._loop)
+
+            await fut
+
+            # Woken without a release when another waiter was cancelled
+            if self._fut is fut:
+                self._fut = None
+
+
+class BroadcastEvent(_Broadcast):
+    """asyncio.Event alternative, setting it wakes every waiter through a single future."""
+
+    def __init__(self, *, loop: T.Optional[AbstractEventLoop] = None) -> None:
+        """BroadcastEvent constructor.
+
+        Arguments:
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        self._set = False
+
+    def is_set(self) -> bool:
+        """Whether the event is set."""
+        return self._set
+
+    def set(self) -> None:
+        """Set the event, waking all waiters."""
+        if not self._set:
+            self._set = True
+            self._release()
+
+    def clear(self) -> None:
+        """Reset the event, so new waiters block until it is set again."""
+        self._set = False
+
+    async def wait(self) -> None:
+        """Wait until the event is set."""
+        if not self._set:
+            await self._wait()
+
+
+class Latch(_Broadcast):
+    """Countdown latch, waiters are released together once it is counted down to zero."""
+
+    def __init__(self, count: int, *, loop: T.Optional[AbstractEventLoop] = None) -> None:
+        """Latch constructor.
+
+        Arguments:
+            count: Number of count downs required to release the waiters.
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        if count < 0:
+            raise ValueError("Latch count must not be negative")
+
+        self._count = count
+
+    @property
+    def count(self) -> int:
+        """Count downs left before the latch is released."""
+        return self._count
+
+    def count_down(self, n: int = 1) -> None:
+        """Decrement the count, releasing all waiters when it reaches zero."""
+        if n < 1:
+            raise ValueError("Latch count down must be a positive integer")
+        if self._count <= 0:
+            return
+
+        self._count = max(self._count - n, 0)
+        if not self._count:
+            self._release()
+
+    async def wait(self) -> None:
+        """Wait until the count reaches zero."""
+        if self._count:
+            await self._wait()
+
+
+class Barrier(_Broadcast):
+    """Reusable barrier, each generation of `parties` waiters is released together."""
+
+    def __init__(self, parties: int, *, loop: T.Optional[AbstractEventLoop] = None) -> None:
+        """Barrier constructor.
+
+        Arguments:
+            parties: Number of waiters that must arrive to release a generation.
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        if parties < 1:
+            raise ValueError("Barrier parties must be a positive integer")
+
+        self._parties = parties
+        # Parties waiting in the current generation, mapped to their arrival index on release
+        self._arrivals: T.Dict[object, int] = {}
+
+    @property
+    def parties(self) -> int:
+        """Number of waiters required to release a generation."""
+        return self._parties
+
+    @property
+    def waiting(self) -> int:
+        """Number of waiters in the current generation."""
+        return len(self._arrivals)
+
+    async def wait(self) -> int:
+        """Wait for the rest of the generation.
+
+        Returns:
+            Arrival index in the generation, from 0 to `parties` - 1.
+
+        """
+        arrivals = self._arrivals
+        if len(arrivals) + 1 == self._parties:
+            # Indexes follow the parties still there, cancelled arrivals left no gap
+            self._arrivals = {}
+            for index, party in enumerate(arrivals):
+                arrivals[party] = index
+            self._release()
+            return len(arrivals)
+
+        party = object()
+        arrivals[party] = -1
+        try:
+            await self._wait()
+        except BaseException:
+            if arrivals is self._arrivals:
+                # Leave the generation, it wasn't released yet
+                del arrivals[party]
+            raise
+
+        return arrivals[party]
+
+
+__all__ = ("Latch", "Barrier", "BroadcastEvent")
@@ -12,4 +12,47 @@ class ReadLock(LockProtocol):
 
 class WriteLock(LockProtocol):
     def can_acquire(self, vault: T.Counter[T.Type["LockProtocol"]]) -> bool:
-        return not vault[ReadLock] and not vault[WriteLock]
+        return not (vault[ReadLock] or vault[WriteLock] or vault[UpgradableReadLock])
+
+
+class UpgradableReadLock(LockProtocol):
+    """Read lock that can be converted to a write lock, see :meth:`AsyncLockStack.upgrade`.
+
+    It coexists with ReadLock holders, but excludes writers and other UpgradableReadLock holders.
+    """
+
+    def can_acquire(self, vault: T.Counter[T.Type["LockProtocol"]]) -> bool:
+        return not (vault[WriteLock] or vault[UpgradableReadLock])
+
+
+class Permits(LockProtocol):
+    """Counting lock, at most `capacity` units of it can be held at the same time.
+
+    Subclass it to declare a resource and its capacity, each acquisition takes `weight` units:
+        class MemoryBudget(Permits, capacity=2 ** 30):
+            pass
+
+        async with lock_stack(MemoryBudget(job_size)):
+            ...
+
+    Acquiring the lock type itself takes a single unit, making it a plain counting semaphore.
+    """
+
+    capacity: T.ClassVar[int] = 1
+
+    def __init_subclass__(cls, capacity: T.Optional[int] = None, **kwargs: T.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if capacity is not None:
+            if capacity < 1:
+                raise ValueError("Permits capacity must be a positive integer")
+            cls.capacity = capacity
+
+    def __init__(self, weight: int = 1) -> None:
+        if not 0 < weight <= self.capacity:
+            raise ValueError(f"Permits weight must be between 1 and {self.capacity}")
+
+        self.weight = weight
+
+    def can_acquire(self, vault: T.Counter[T.Type["LockProtocol"]]) -> bool:
+        return vault[type(self)] + self.weight <= self.capacity
@@ -0,0 +1,12 @@
+# Strict arrival order, regardless of lock type
+FIFO = "FIFO"
+# Readers are admitted whenever no writer holds the lock, even with writers waiting
+READER_PREFERRING = "READER_PREFERRING"
+# Waiting writers are admitted before any waiting reader, new readers wait for them
+WRITER_PREFERRING = "WRITER_PREFERRING"
+# Lock types take turns, every reader waiting when a writer releases is admitted as one batch
+PHASE_FAIR = "PHASE_FAIR"
+
+POLICIES = (FIFO, READER_PREFERRING, WRITER_PREFERRING, PHASE_FAIR)
+
+__all__ = ("FIFO", "PHASE_FAIR", "READER_PREFERRING", "WRITER_PREFERRING")
@@ -0,0 +1,81 @@
+# Internal
+import typing as T
+from heapq import heapify, heappop, heappush
+from asyncio import Future
+
+# Project
+from ._protocol import LockProtocol
+
+_Waiter = T.Tuple["Future[None]", LockProtocol]
+
+
+class _FifoQueue(T.OrderedDict[int, _Waiter]):
+    """Waiters of a lock type in arrival order, keyed by arrival sequence."""
+
+    __slots__ = ()
+
+    def order(self) -> T.Any:
+        return next(iter(self))
+
+    def head(self) -> _Waiter:
+        return next(iter(self.values()))
+
+    def pop_head(self) -> None:
+        self.popitem(last=False)
+
+    def push(self, seq: int, waiter: _Waiter, priority: float, now: float) -> None:
+        self[seq] = waiter
+
+    def discard(self, seq: int) -> bool:
+        return self.pop(seq, None) is not None
+
+
+class _PriorityQueue(T.Dict[int, _Waiter]):
+    """Waiters of a lock type by priority, keyed by arrival sequence.
+
+    A waiter is ordered by its arrival time minus `aging` seconds per priority level. All waiters
+    age at the same rate, so the order never changes after queueing, and a waiter is only ever
+    overtaken by higher priority waiters arriving less than `aging` seconds per level after it.
+    Removed waiters are dropped from the heap lazily.
+    """
+
+    __slots__ = ("_heap", "_aging")
+
+    def __init__(self, aging: float) -> None:
+        super().__init__()
+        self._heap: T.List[T.Tuple[float, int]] = []
+        self._aging = aging
+
+    def _top(self) -> T.Tuple[float, int]:
+        heap = self._heap
+        while heap[0][1] not in self:
+            heappop(heap)
+        return heap[0]
+
+    def order(self) -> T.Any:
+        return self._top()
+
+    def head(self) -> _Waiter:
+        return self[self._top()[1]]
+
+    def pop_head(self) -> None:
+        del self[self._top()[1]]
+        heappop(self._heap)
+
+    def push(self, seq: int, waiter: _Waiter, priority: float, now: float) -> None:
+        self[seq] = waiter
+        heappush(self._heap, (now - priority * self._aging, seq))
+
+    def discard(self, seq: int) -> bool:
+        if self.pop(seq, None) is None:
+            return False
+
+        heap = self._heap
+        if len(heap) > 2 * len(self) + 8:
+            # Compact, so timeout storms don't leave the heap full of dead entries
+            heap[:] = [entry for entry in heap if entry[1] in self]
+            heapify(heap)
+        return True
+
+
+_WaiterQueue = T.Union[_FifoQueue, _PriorityQueue]
@@ -0,0 +1,134 @@
+# Internal
+import typing as T
+from types import TracebackType
+from asyncio import Future, AbstractEventLoop, shield
+
+# Project
+from ._locks import WriteLock
+from ..loopable import Loopable
+from ..attempt_await import maybe_await
+from ._async_lock_stack import AsyncLockStack
+
+# Generic types
+K = T.TypeVar("K")
+
+
+class _ReadContext(T.ContextManager[K]):
+    __slots__ = ("_cell", "_value", "_version")
+
+    def __init__(self, cell: "RCUCell[K]") -> None:
+        self._cell = cell
+
+    def __enter__(self) -> K:
+        # Snapshot taken on enter, an update between read() and enter isn't missed
+        cell = self._cell
+        self._value = value = cell._value
+        self._version = version = cell._version
+        readers = cell._readers
+        readers[version] = readers.get(version, 0) + 1
+        return value
+
+    def __exit__(
+        self,
+        exc_type: T.Optional[T.Type[BaseException]],
+        exc_value: T.Optional[BaseException],
+        traceback: T.Optional[TracebackType],
+    ) -> None:
+        self._cell._read_done(self._version)
+
+
+class RCUCell(Loopable, T.Generic[K]):
+    """Read-copy-update cell, for read mostly shared state such as routing tables.
+
+    Readers get the current snapshot synchronously, without any lock or await. Writers are
+    serialized and publish a new snapshot by replacing the old one, never by mutating it, so
+    snapshots must be treated as immutable. Readers that keep a snapshot across awaits should
+    hold it through `read`, which allows writers to wait for them with `synchronize`.
+    """
+
+    def __init__(self, value: K, *, loop: T.Optional[AbstractEventLoop] = None) -> None:
+        """RCUCell constructor.
+
+        Arguments:
+            value: Initial snapshot.
+            loop: Existing asyncio loop to be used.
+
+        """
+        super().__init__(loop=loop)
+
+        self._lock = AsyncLockStack(loop=self._loop)
+        self._value = value
+        self._version = 0
+        self._readers: T.Dict[int, int] = {}
+        self._drained: T.Optional["Future[None]"] = None
+
+    @property
+    def value(self) -> K:
+        """Current snapshot."""
+        return self._value
+
+    @property
+    def version(self) -> int:
+        """Number of snapshots published since creation."""
+        return self._version
+
+    def read(self) -> T.ContextManager[K]:
+        """Context manager holding the current snapshot, see `synchronize`."""
+        return _ReadContext(self)
+
+    def _read_done(self, version: int) -> None:
+        readers = self._readers
+        count = readers[version] - 1
+        if count or version == self._version:
+            readers[version] = count
+            return
+
+        del readers[version]
+        drained, self._drained = self._drained, None
+        if drained is not None and not drained.done():
+            drained.set_result(None)
+
+    async def synchronize(self) -> None:
+        """Grace period, wait for every reader holding a snapshot older than the current one."""
+        version = self._version
+        while any(reader_version < version for reader_version in self._readers):
+            if self._drained is None:
+                self._drained = self._loop.create_future()
+            # Shared by every waiter, cancelling one of them mustn't cancel it for the others
+            await shield(self._drained)
+
+    async def update(
+        self, func: T.Callable[[K], T.Union[T.Awaitable[K], K]], *, wait_readers: bool = False
+    ) -> K:
+        """Publish the snapshot returned by `func` when called with the current one.
+
+        Arguments:
+            func: Function, or coroutine function, creating the new snapshot from the current.
+            wait_readers: Only return after the grace period of the previous snapshot.
+
+        Returns:
+            The published snapshot.
+
+        """
+        async with self._lock(WriteLock):
+            value = await maybe_await(func(self._value))
+            self._value = value
+            self._version += 1
+
+            # Readers of the previous version may have already left
+            readers = self._readers
+            previous = self._version - 1
+            if readers.get(previous, None) == 0:
+                del readers[previous]
+
+        if wait_readers:
+            await self.synchronize()
+
+        return value
+
+    async def set(self, value: K, *, wait_readers: bool = False) -> None:
+        """Publish value as the new snapshot, see `update`."""
+        await self.update(lambda _: value, wait_readers=wait_readers)
+
+
+__all__ = ("RCUCell",)
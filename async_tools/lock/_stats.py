@@ -0,0 +1,80 @@
+# Internal
+import typing as T
+from asyncio import Task
+
+# Project
+from ._protocol import LockProtocol
+
+# Instrumentation events, passed to the AsyncLockStack hook alongside the lock type and a duration
+ACQUIRED = "ACQUIRED"  # Duration is the time spent waiting for the lock
+RELEASED = "RELEASED"  # Duration is the time the lock was held
+CANCELLED = "CANCELLED"  # Duration is the time spent waiting until the waiter gave up
+
+LockHook = T.Callable[[str, T.Type[LockProtocol], float], None]
+
+
+class LockStats(T.NamedTuple):
+    """Snapshot of the activity of a lock type in an AsyncLockStack, durations in seconds.
+
+    `holding` counts units held, which is the number of holders unless the lock is weighted.
+    """
+
+    acquisitions: int
+    contended: int
+    cancelled: int
+    holding: int
+    waiting: int
+    max_waiting: int
+    wait_total: float
+    wait_max: float
+    hold_total: float
+    hold_max: float
+
+
+class LockHolder(T.NamedTuple):
+    """Current holder of a lock in an AsyncLockStack."""
+
+    lock_type: T.Type[LockProtocol]
+    task: T.Optional["Task[T.Any]"]
+    since: float
+    held: float
+
+
+class _Recorder:
+    __slots__ = (
+        "wait_max",
+        "hold_max",
+        "contended",
+        "cancelled",
+        "wait_total",
+        "hold_total",
+        "max_waiting",
+        "acquisitions",
+    )
+
+    def __init__(self) -> None:
+        self.wait_max = 0.0
+        self.hold_max = 0.0
+        self.contended = 0
+        self.cancelled = 0
+        self.wait_total = 0.0
+        self.hold_total = 0.0
+        self.max_waiting = 0
+        self.acquisitions = 0
+
+    def snapshot(self, holding: int, waiting: int) -> LockStats:
+        return LockStats(
+            acquisitions=self.acquisitions,
+            contended=self.contended,
+            cancelled=self.cancelled,
+            holding=holding,
+            waiting=waiting,
+            max_waiting=self.max_waiting,
+            wait_total=self.wait_total,
+            wait_max=self.wait_max,
+            hold_total=self.hold_total,
+            hold_max=self.hold_max,
+        )
+
+
+__all__ = ("ACQUIRED", "RELEASED", "CANCELLED", "LockStats", "LockHolder")
@@ -2,3 +2,4 @@
 from .aexit import aexit
 from .aiter import aiter
 from .anext import anext
+from .abatch import abatch
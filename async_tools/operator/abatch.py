@@ -0,0 +1,101 @@
+# Internal
+import typing as T
+from asyncio import Future, wait, get_running_loop
+
+# Project
+from .aiter import aiter
+from .anext import anext
+from ..eager_task import eager_task
+
+# Generic types
+K = T.TypeVar("K")
+
+_end = object()  # sentinel object to detect the end of the source
+_expired = object()  # sentinel object to detect that max_delay is over
+
+
+async def abatch(
+    iterable: T.AsyncIterable[K], *, max_size: int, max_delay: T.Optional[float] = None
+) -> T.AsyncGenerator[T.List[K], None]:
+    """Group the items of an async iterable in lists.
+
+    A list is yielded once it has `max_size` items, or `max_delay` seconds after its first item
+    arrived, whichever comes first. Leaving the iteration early closes the source. When the
+    source raises, the items already taken from it are yielded before the error is raised.
+
+    Arguments:
+        iterable: AsyncIterable whose items are grouped.
+        max_size: Maximum number of items in each list.
+        max_delay: Maximum time, in seconds, an item waits for its list to be yielded.
+
+    Returns:
+        AsyncGenerator of non empty lists of items.
+
+    """
+    if max_size < 1:
+        raise ValueError("max_size must be a positive integer")
+    if max_delay is not None and max_delay < 0:
+        raise ValueError("max_delay must not be negative")
+
+    loop = get_running_loop()
+    source: T.AsyncIterator[K] = aiter(iterable)
+    batch: T.List[K] = []
+    fetch: T.Optional["Future[T.Union[K, object]]"] = None
+    deadline = 0.0
+
+    try:
+        while True:
+            item: T.Union[K, object]
+            try:
+                if fetch is None and (max_delay is None or not batch):
+                    # Nothing to time out, wait for the next item inline
+                    item = await anext(source, _end)
+                else:
+                    if fetch is None:
+                        # Items already available in the source don't go through the loop
+                        fetch = eager_task(anext(source, _end))
+
+                    if not fetch.done():
+                        await wait((fetch,), timeout=deadline - loop.time() if batch else None)
+
+                    if fetch.done():
+                        item, fetch = fetch.result(), None
+                    else:
+                        # The pending fetch carries on to the next batch
+                        item = _expired
+            except Exception:
+                if batch:
+                    # Hand over the items already taken from the source before failing
+                    batch, ready = [], batch
+                    yield ready
+                raise
+
+            if item is _expired:
+                batch, ready = [], batch
+                yield ready
+                continue
+
+            if item is _end:
+                break
+
+            if max_delay is not None and not batch:
+                deadline = loop.time() + max_delay
+
+            batch.append(T.cast(K, item))
+            if len(batch) >= max_size:
+                batch, ready = [], batch
+                yield ready
+
+        if batch:
+            yield batch
+    finally:
+        if fetch is not None and not fetch.done():
+            fetch.cancel()
+            await wait((fetch,))
+
+        aclose = getattr(source, "aclose", None)
+        if callable(aclose):
+            await aclose()
+
+
+__all__ = ("abatch",)
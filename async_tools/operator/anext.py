@@ -13,12 +13,12 @@ _undefined = T.cast(None, object())
 
 
 @T.overload
-async def anext(async_iterator: T.AsyncGenerator[K, T.Any]) -> K:
+async def anext(async_iterator: T.AsyncIterator[K]) -> K:
     ...
 
 
 @T.overload
-async def anext(async_iterator: T.AsyncGenerator[K, T.Any], default: L) -> T.Union[K, L]:
+async def anext(async_iterator: T.AsyncIterator[K], default: L) -> T.Union[K, L]:
     ...
 
 
@@ -10,6 +10,9 @@ from asyncio import Future, AbstractEventLoop, get_running_loop
 from threading import Thread
 from concurrent.futures.thread import ThreadPoolExecutor
 
+# Project
+from .drain_executors import _drain_default_executor
+
 
 def _do_shutdown(
     loop: "AbstractEventLoop", default_executor: "ThreadPoolExecutor", future: "Future[None]"
@@ -21,11 +24,19 @@ def _do_shutdown(
         loop.call_soon_threadsafe(future.set_exception, ex)
 
 
-async def shutdown_default_executor() -> None:
-    """Schedule the shutdown of the default executor."""
+async def shutdown_default_executor(*, timeout: T.Optional[float] = None) -> None:
+    """Schedule the shutdown of the default executor.
+
+    With a `timeout`, the executor is drained instead, see :func:`drain_executor`, and the
+    loop creates a new one if it is needed again.
+    """
 
     loop = get_running_loop()
 
+    if timeout is not None:
+        await _drain_default_executor(loop, timeout)
+        return
+
     og: T.Optional[T.Callable[[], T.Awaitable[None]]] = getattr(
         loop, "shutdown_default_executor", None
     )
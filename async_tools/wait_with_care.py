@@ -1,21 +1,167 @@
 # Internal
 import typing as T
-from asyncio import Future, wait, iscoroutine, get_event_loop
+from asyncio import Future, AbstractEventLoop, wait, iscoroutine, ensure_future, get_event_loop
+from inspect import isawaitable
+from collections import deque
 from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, FIRST_EXCEPTION
 
+# Project
+from .eager_task import eager_task
+from .error_aggregator import ErrorAggregator
+
 # Generic types
 K = T.TypeVar("K")
 
+_Source = T.Union[T.Iterator[T.Awaitable[K]], T.AsyncIterator[T.Awaitable[K]]]
+
+
+def _check(
+    fut: "Future[K]",
+    loop: AbstractEventLoop,
+    ignore_cancelled: bool,
+    raise_first_error: bool,
+    reporter: T.Optional[ErrorAggregator] = None,
+) -> None:
+    if fut.cancelled() and ignore_cancelled:
+        return
+
+    exc = fut.exception()
+    if isinstance(exc, Exception):
+        if raise_first_error:
+            raise exc
+
+        if reporter is not None:
+            reporter.add(exc)
+            return
+
+        loop.call_exception_handler(
+            {
+                "future": fut,
+                "message": f"Exception was raised while waiting {repr(fut)}",
+                "exception": exc,
+            }
+        )
+    elif exc is not None:
+        # BaseExceptions
+        raise exc
+
+
+def _start(awaitable: T.Awaitable[K], loop: AbstractEventLoop, eager: bool) -> "Future[K]":
+    if iscoroutine(awaitable):
+        return eager_task(awaitable, loop=loop) if eager else loop.create_task(awaitable)
+    return ensure_future(awaitable, loop=loop)
+
+
+def _source(
+    futures: T.Tuple[
+        T.Union[T.Awaitable[K], T.Iterable[T.Awaitable[K]], T.AsyncIterable[T.Awaitable[K]]], ...
+    ],
+    limit: T.Optional[int],
+) -> T.Optional["_Source[K]"]:
+    if len(futures) == 1 and not isawaitable(futures[0]):
+        (source,) = futures
+        if isinstance(source, T.AsyncIterable):
+            return source.__aiter__()
+        return iter(T.cast(T.Iterable[T.Awaitable[K]], source))
+
+    return None if limit is None else iter(T.cast(T.Iterable[T.Awaitable[K]], futures))
+
+
+async def _wait_lazily(
+    source: "_Source[K]",
+    limit: T.Optional[int],
+    return_when: str,
+    eager: bool,
+    loop: AbstractEventLoop,
+) -> T.Tuple[T.Set["Future[K]"], T.Set["Future[K]"]]:
+    done: T.Set["Future[K]"] = set()
+    pending: T.Set["Future[K]"] = set()
+    completed: T.Deque["Future[K]"] = deque()
+    wakeup: T.Optional["Future[None]"] = None
+    exhausted = False
+
+    def on_completion(fut: "Future[K]") -> None:
+        completed.append(fut)
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    try:
+        while True:
+            # Only start new tasks when there is room for them
+            while not exhausted and (limit is None or len(pending) < limit):
+                try:
+                    if isinstance(source, T.AsyncIterator):
+                        awaitable = await source.__anext__()
+                    else:
+                        awaitable = next(source)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+
+                task = _start(awaitable, loop, eager)
+                pending.add(task)
+                if task.done():
+                    completed.append(task)
+                else:
+                    task.add_done_callback(on_completion)
+
+            if not pending:
+                break
+
+            if not completed:
+                wakeup = loop.create_future()
+                await wakeup
+
+            finished = False
+            while completed:
+                fut = completed.popleft()
+                pending.discard(fut)
+                done.add(fut)
+                # Keep going, every completed future ends up in done, like asyncio.wait
+                finished = finished or (
+                    return_when == FIRST_COMPLETED
+                    or (
+                        return_when == FIRST_EXCEPTION
+                        and not fut.cancelled()
+                        and fut.exception() is not None
+                    )
+                )
+
+            if finished:
+                return done, pending
+    finally:
+        for fut in pending:
+            fut.remove_done_callback(on_completion)
+
+    return done, pending
+
 
 async def wait_with_care(
-    *futures: T.Awaitable[K],
+    *futures: T.Union[T.Awaitable[K], T.Iterable[T.Awaitable[K]], T.AsyncIterable[T.Awaitable[K]]],
     return_when: T.Optional[str] = None,
     ignore_cancelled: bool = False,
     raise_first_error: bool = False,
+    limit: T.Optional[int] = None,
+    reporter: T.Optional[ErrorAggregator] = None,
+    eager: bool = False,
 ) -> T.Tuple[T.Set["Future[K]"], T.Set["Future[K]"]]:
+    """Wait for the given awaitables, reporting their errors to the loop exception handler.
+
+    A single iterable, or async iterable, of awaitables is consumed lazily. With `limit`, at
+    most that many tasks run at once, new ones only being started as earlier ones finish. When
+    returning early, awaitables not yet taken from the iterable are left there.
+
+    With a `reporter`, errors are aggregated by it instead of being reported one by one.
+
+    With `eager`, coroutines are run until they first suspend before being scheduled (see
+    eager_task), so the ones finishing synchronously never cost a task or a loop iteration.
+    """
     if not futures:
         return set(), set()
 
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer")
+
     loop = get_event_loop()
 
     if return_when is None:
@@ -23,34 +169,84 @@ async def wait_with_care(
 
     assert return_when in (ALL_COMPLETED, FIRST_COMPLETED, FIRST_EXCEPTION)
 
-    done, pending = await wait(
-        tuple(loop.create_task(task) if iscoroutine(task) else task for task in futures),
-        return_when=return_when,
-    )
+    done: T.Set["Future[K]"]
+    pending: T.Set["Future[K]"]
+    source = _source(futures, limit)
+    if source is None:
+        done = set()
+        pending = set()
+        for fut in (_start(T.cast(T.Awaitable[K], task), loop, eager) for task in futures):
+            (done if fut.done() else pending).add(fut)
+
+        # Only wait when the futures already done don't satisfy return_when
+        if pending and not (
+            (done and return_when == FIRST_COMPLETED)
+            or (
+                return_when == FIRST_EXCEPTION
+                and any(not fut.cancelled() and fut.exception() is not None for fut in done)
+            )
+        ):
+            newly_done, pending = await wait(pending, return_when=return_when)
+            done |= newly_done
+    else:
+        done, pending = await _wait_lazily(source, limit, return_when, eager, loop)
 
     assert return_when != ALL_COMPLETED or not pending
 
     for fut in done:
-        if fut.cancelled() and ignore_cancelled:
-            continue
-
-        exc = fut.exception()
-        if isinstance(exc, Exception):
-            if raise_first_error:
-                raise exc
-
-            loop.call_exception_handler(
-                {
-                    "future": fut,
-                    "message": f"Exception was raised while waiting {repr(fut)}",
-                    "exception": exc,
-                }
-            )
-        elif exc is not None:
-            # BaseExceptions
-            raise exc
+        _check(fut, loop, ignore_cancelled, raise_first_error, reporter)
 
     return done, pending
 
 
-__all__ = ("wait_with_care", "ALL_COMPLETED", "FIRST_COMPLETED", "FIRST_EXCEPTION")
+async def as_completed_with_care(
+    *futures: T.Awaitable[K],
+    ignore_cancelled: bool = False,
+    raise_first_error: bool = False,
+    reporter: T.Optional[ErrorAggregator] = None,
+) -> T.AsyncIterator["Future[K]"]:
+    """Yield each future once, as it completes, with the same error handling as wait_with_care.
+
+    A single done callback per future feeds a queue, so each completion costs O(1) instead of
+    re-registering callbacks on every pending future as repeated wait_with_care calls do.
+    Leaving the iteration early doesn't cancel the futures that are still pending.
+    """
+    if not futures:
+        return
+
+    loop = get_event_loop()
+    tasks = tuple(loop.create_task(task) if iscoroutine(task) else task for task in futures)
+    pending = set(tasks)
+    completed: T.Deque["Future[K]"] = deque()
+    wakeup: T.Optional["Future[None]"] = None
+
+    def on_completion(fut: "Future[K]") -> None:
+        completed.append(fut)
+        if wakeup is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    for fut in tasks:
+        T.cast("Future[K]", fut).add_done_callback(on_completion)
+
+    try:
+        while pending:
+            if not completed:
+                wakeup = loop.create_future()
+                await wakeup
+
+            fut = completed.popleft()
+            pending.discard(fut)
+            _check(fut, loop, ignore_cancelled, raise_first_error, reporter)
+            yield fut
+    finally:
+        for fut in pending:
+            T.cast("Future[K]", fut).remove_done_callback(on_completion)
+
+
+__all__ = (
+    "wait_with_care",
+    "as_completed_with_care",
+    "ALL_COMPLETED",
+    "FIRST_COMPLETED",
+    "FIRST_EXCEPTION",
+)
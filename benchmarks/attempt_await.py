@@ -0,0 +1,58 @@
+"""Per call overhead of attempt_await, compared to its previous task based implementation.
+
+    python -m benchmarks.attempt_await --calls 100000
+"""
+
+# Internal
+import time
+import typing as T
+import asyncio
+from argparse import ArgumentParser
+
+# External
+from async_tools import maybe_await, attempt_await
+
+
+async def task_attempt_await(maybe_awaitable: T.Any) -> T.Any:
+    # attempt_await before the fast path, wrapping every awaitable in a task
+    try:
+        fut = asyncio.ensure_future(maybe_awaitable)
+    except TypeError:
+        return maybe_awaitable
+    return await fut
+
+
+async def coroutine() -> int:
+    return 1
+
+
+async def bench(
+    func: T.Callable[[T.Any], T.Awaitable[T.Any]], value: T.Callable[[], T.Any], calls: int
+) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await func(value())
+    return time.perf_counter() - start
+
+
+async def run(calls: int) -> None:
+    for kind, value in (("coroutine", coroutine), ("value", lambda: 1)):
+        for name, func in (
+            ("task based", task_attempt_await),
+            ("attempt_await", attempt_await),
+            ("maybe_await", maybe_await),
+        ):
+            elapsed = await bench(func, value, calls)
+            print(f"{kind:<10} {name:<14} {elapsed / calls * 1e6:6.2f}µs per call")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Time to wake every waiter of asyncio.Event and BroadcastEvent.
+
+    python -m benchmarks.broadcast --waiters 10000
+"""
+
+# Internal
+import time
+import typing as T
+import asyncio
+from argparse import ArgumentParser
+
+# External
+from async_tools.lock import BroadcastEvent
+
+
+async def bench(event: T.Union[asyncio.Event, BroadcastEvent], waiters: int) -> float:
+    tasks = [asyncio.ensure_future(event.wait()) for _ in range(waiters)]
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    event.set()
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+async def run(waiters: int) -> None:
+    for name, elapsed in (
+        ("asyncio.Event", await bench(asyncio.Event(), waiters)),
+        ("BroadcastEvent", await bench(BroadcastEvent(), waiters)),
+    ):
+        print(f"{name:<16} {elapsed * 1e3:8.2f}ms to wake {waiters} waiters")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--waiters", type=int, default=10_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.waiters))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Time for wait_with_care to run a mix of synchronous and suspending coroutines, eager or not.
+
+    python -m benchmarks.eager --coroutines 10000 --hit-ratio 0.9
+"""
+
+# Internal
+import time
+import random
+import asyncio
+from argparse import ArgumentParser
+
+# External
+from async_tools import wait_with_care
+
+
+async def lookup(hit: bool) -> int:
+    if not hit:
+        # Cache miss, actually suspend
+        await asyncio.sleep(0)
+    return 1
+
+
+async def bench(hits: "list[bool]", eager: bool) -> float:
+    start = time.perf_counter()
+    await wait_with_care(*(lookup(hit) for hit in hits), eager=eager)
+    return time.perf_counter() - start
+
+
+async def run(coroutines: int, hit_ratio: float, rounds: int) -> None:
+    hits = [random.random() < hit_ratio for _ in range(coroutines)]
+    for eager in (False, True):
+        elapsed = min([await bench(hits, eager) for _ in range(rounds)])
+        print(
+            f"eager={eager!s:<5} {elapsed * 1e3:8.2f}ms"
+            f" ({elapsed / coroutines * 1e6:.2f}µs per coroutine)"
+        )
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--coroutines", type=int, default=10_000)
+    parser.add_argument("--hit-ratio", type=float, default=0.9)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.coroutines, args.hit_ratio, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Throughput of CPU-bound `thread` decorated functions.
+
+Run it with a regular and with a free-threaded (3.13t+) interpreter to compare both builds:
+    python -m benchmarks.free_threading
+    python3.13t -m benchmarks.free_threading
+"""
+
+# Internal
+import sys
+import time
+import asyncio
+from argparse import ArgumentParser
+
+# External
+from async_tools.decorator import thread
+from async_tools.decorator._free_threading import cpu_workers, gil_enabled
+
+
+@thread
+def spin(iterations: int) -> int:
+    total = 0
+    for i in range(iterations):
+        total += i * i % 7
+    return total
+
+
+async def run(calls: int, iterations: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(spin(iterations) for _ in range(calls)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=cpu_workers() * 4)
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    for _ in range(args.calls):
+        spin(args.iterations)
+    sequential = time.perf_counter() - start
+
+    concurrent = asyncio.run(run(args.calls, args.iterations))
+
+    print(f"python {sys.version.split()[0]}, gil enabled: {gil_enabled()}, cpus: {cpu_workers()}")
+    print(f"sequential: {args.calls / sequential:10.2f} calls/s")
+    print(f"decorated:  {args.calls / concurrent:10.2f} calls/s ({sequential / concurrent:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per acquisition overhead of uncontended AsyncLockStack locks.
+
+    python -m benchmarks.lock_acquire --acquisitions 1000000
+"""
+
+# Internal
+import time
+import typing as T
+import asyncio
+from argparse import ArgumentParser
+
+# External
+from async_tools.lock import RCUCell, ReadLock, WriteLock, AsyncLockStack, AsyncKeyedLockStack
+
+
+async def bench_stack(acquisitions: int, lock_type: type, instrument: bool = False) -> float:
+    lock = AsyncLockStack(instrument=instrument)
+    start = time.perf_counter()
+    for _ in range(acquisitions):
+        async with lock(lock_type):
+            pass
+    return time.perf_counter() - start
+
+
+async def bench_keyed(acquisitions: int, stripes: T.Optional[int]) -> float:
+    lock: AsyncKeyedLockStack[int] = AsyncKeyedLockStack(stripes=stripes)
+    start = time.perf_counter()
+    for i in range(acquisitions):
+        async with lock(i % 1024, ReadLock):
+            pass
+    return time.perf_counter() - start
+
+
+async def bench_rcu(acquisitions: int) -> float:
+    cell = RCUCell({})
+    start = time.perf_counter()
+    for _ in range(acquisitions):
+        with cell.read():
+            pass
+    return time.perf_counter() - start
+
+
+async def bench_asyncio(acquisitions: int) -> float:
+    lock = asyncio.Lock()
+    start = time.perf_counter()
+    for _ in range(acquisitions):
+        async with lock:
+            pass
+    return time.perf_counter() - start
+
+
+async def run(acquisitions: int) -> None:
+    for name, elapsed in (
+        ("asyncio.Lock", await bench_asyncio(acquisitions)),
+        ("AsyncLockStack ReadLock", await bench_stack(acquisitions, ReadLock)),
+        ("AsyncLockStack WriteLock", await bench_stack(acquisitions, WriteLock)),
+        ("AsyncLockStack instrumented", await bench_stack(acquisitions, ReadLock, True)),
+        ("AsyncKeyedLockStack", await bench_keyed(acquisitions, None)),
+        ("AsyncKeyedLockStack 64", await bench_keyed(acquisitions, 64)),
+        ("RCUCell read", await bench_rcu(acquisitions)),
+    ):
+        print(f"{name:<28} {elapsed / acquisitions * 1e9:8.1f}ns per acquisition")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--acquisitions", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.acquisitions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""AsyncLockStack under heavy contention.
+
+A writer holds the lock while a mix of readers and writers queue behind it, the benchmark then
+measures how long the whole queue takes to drain and whether waiters were granted in arrival order:
+    python -m benchmarks.lock_contention --waiters 10000
+"""
+
+# Internal
+import time
+import random
+import asyncio
+from argparse import ArgumentParser
+
+# External
+from async_tools.lock import FIFO, ReadLock, WriteLock, AsyncLockStack
+from async_tools.lock._policy import POLICIES
+
+
+async def run(waiters: int, writers: float, policy: str) -> None:
+    lock = AsyncLockStack(policy=policy)
+    release = asyncio.get_running_loop().create_future()
+    granted = []
+
+    async def hold() -> None:
+        async with lock(WriteLock):
+            await release
+
+    async def wait(index: int, lock_type: type) -> None:
+        async with lock(lock_type):
+            granted.append(index)
+            if lock_type is WriteLock:
+                # Give queued waiters a chance to pile up behind the writer
+                await asyncio.sleep(0)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    lock_types = [WriteLock if random.random() < writers else ReadLock for _ in range(waiters)]
+    tasks = [asyncio.create_task(wait(i, t)) for i, t in enumerate(lock_types)]
+    # Let every waiter enqueue itself
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    release.set_result(None)
+    await asyncio.gather(holder, *tasks)
+    elapsed = time.perf_counter() - start
+
+    print(f"policy: {policy}, waiters: {waiters}, writers: {lock_types.count(WriteLock)}")
+    print(f"drained in {elapsed * 1000:.2f}ms ({elapsed / waiters * 1e6:.2f}us per waiter)")
+    print(f"granted in arrival order: {granted == sorted(granted)}")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--waiters", type=int, default=10_000)
+    parser.add_argument("--writers", type=float, default=0.1, help="ratio of writers")
+    parser.add_argument("--policy", choices=POLICIES, default=FIFO)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.waiters, args.writers, args.policy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Internal
+import asyncio
+import unittest
+
+# External
+import asynctest
+
+from async_tools.operator import abatch
+
+_end = object()
+
+
+async def produce(items, closed=None):
+    try:
+        for item in items:
+            yield item
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+
+async def consume(queue, closed=None):
+    # Items are only available once the test puts them
+    try:
+        while True:
+            item = await queue.get()
+            if item is _end:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+
+class ABatchTestCase(asynctest.TestCase, unittest.TestCase):
+    async def test_max_size(self):
+        batches = [batch async for batch in abatch(produce(range(7)), max_size=3)]
+        self.assertEqual(batches, [[0, 1, 2], [3, 4, 5], [6]])
+
+        batches = [batch async for batch in abatch(produce(range(4)), max_size=3, max_delay=10)]
+        self.assertEqual(batches, [[0, 1, 2], [3]])
+
+        self.assertEqual([batch async for batch in abatch(produce([]), max_size=3)], [])
+
+    async def test_max_delay(self):
+        queue = asyncio.Queue()
+        batches = abatch(consume(queue), max_size=10, max_delay=0.01)
+
+        queue.put_nowait(0)
+        queue.put_nowait(1)
+        # Nothing else arrives, the batch is yielded once max_delay is over
+        self.assertEqual(await asyncio.wait_for(batches.__anext__(), 1), [0, 1])
+
+        queue.put_nowait(2)
+        queue.put_nowait(3)
+        queue.put_nowait(_end)
+        self.assertEqual([batch async for batch in batches], [[2, 3]])
+
+    async def test_source_error(self):
+        queue = asyncio.Queue()
+        batches = abatch(consume(queue), max_size=10, max_delay=10)
+
+        for item in (0, 1, Exception("--Test Error--")):
+            queue.put_nowait(item)
+
+        # The items taken before the error aren't lost
+        self.assertEqual(await asyncio.wait_for(batches.__anext__(), 1), [0, 1])
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            await batches.__anext__()
+
+    async def test_early_exit(self):
+        closed = []
+        queue = asyncio.Queue()
+        batches = abatch(consume(queue, closed), max_size=10, max_delay=0.01)
+
+        queue.put_nowait(0)
+        queue.put_nowait(1)
+        async for batch in batches:
+            self.assertEqual(batch, [0, 1])
+            break
+
+        # The fetch still waiting for the next item is cancelled and the source closed
+        await batches.aclose()
+        self.assertEqual(closed, [True])
+
+    async def test_invalid(self):
+        with self.assertRaises(ValueError):
+            await abatch(produce([]), max_size=0).__anext__()
+
+        with self.assertRaises(ValueError):
+            await abatch(produce([]), max_size=1, max_delay=-1).__anext__()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Internal
+import asyncio
+import unittest
+
+# External
+from async_tools import (
+    CLOSE,
+    DRAIN,
+    FLUSH,
+    STOP_INTAKE,
+    ErrorAggregator,
+    at_loop_shutdown,
+    set_shutdown_budget,
+)
+
+
+class AtLoopShutdownTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.loop_exceptions = []
+        self.loop.set_exception_handler(lambda loop, context: self.loop_exceptions.append(context))
+
+    def tearDown(self) -> None:
+        self.loop.close()
+
+    def shutdown(self, setup) -> None:
+        self.loop.run_until_complete(setup())
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+
+    def test_phases_order(self):
+        calls = []
+
+        def callback(name):
+            async def call(loop):
+                calls.append(f"{name} start")
+                await asyncio.sleep(0.01 if name == "drain 1" else 0)
+                calls.append(f"{name} end")
+
+            return call
+
+        async def setup():
+            at_loop_shutdown(callback("close"))
+            at_loop_shutdown(callback("flush"), phase=FLUSH)
+            at_loop_shutdown(callback("drain 1"), phase=DRAIN)
+            at_loop_shutdown(callback("drain 2"), phase=DRAIN)
+            at_loop_shutdown(lambda loop: calls.append("stop"), phase=STOP_INTAKE)
+
+        self.shutdown(setup)
+
+        self.assertEqual(
+            calls,
+            [
+                "stop",
+                # Callbacks of a phase run concurrently
+                "drain 1 start",
+                "drain 2 start",
+                "drain 2 end",
+                "drain 1 end",
+                "flush start",
+                "flush end",
+                "close start",
+                "close end",
+            ],
+        )
+        self.assertEqual(self.loop_exceptions, [])
+
+    def test_budget_overrun(self):
+        calls = []
+        cancelled = []
+
+        async def slow(loop):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def setup():
+            set_shutdown_budget(DRAIN, 0.01)
+            at_loop_shutdown(slow, phase=DRAIN)
+            at_loop_shutdown(lambda loop: calls.append("close"), phase=CLOSE)
+
+        self.shutdown(setup)
+
+        self.assertEqual(calls, ["close"])
+        self.assertEqual(cancelled, [True])
+        (context,) = self.loop_exceptions
+        self.assertEqual(context["phase"], DRAIN)
+        # The cancelled callback was given time to finish
+        self.assertTrue(all(task.done() for task in context["pending"]))
+        self.assertIn("budget", context["message"])
+
+    def test_error_reported(self):
+        calls = []
+
+        def fail(loop):
+            raise Exception("--Test Error--")
+
+        async def setup():
+            at_loop_shutdown(fail, phase=FLUSH)
+            at_loop_shutdown(lambda loop: calls.append("close"))
+
+        self.shutdown(setup)
+
+        self.assertEqual(calls, ["close"])
+        (context,) = self.loop_exceptions
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            raise context["exception"]
+
+    def test_error_aggregator_flushed(self):
+        async def setup():
+            reporter = ErrorAggregator(interval=10)
+            reporter.add(Exception("--Test Error--"))
+            reporter.flush()
+            # Rate limited, the next report is only due in 10 seconds
+            reporter.add(Exception("--Test Error--"))
+            reporter.add(Exception("--Test Error--"))
+
+        self.shutdown(setup)
+
+        # The pending report isn't dropped along with the loop
+        self.assertEqual(len(self.loop_exceptions), 2)
+        self.assertEqual(list(self.loop_exceptions[1]["errors"].values()), [2])
+
+    def test_invalid_phase(self):
+        async def setup():
+            with self.assertRaises(ValueError):
+                at_loop_shutdown(lambda loop: None, phase="LATER")
+            with self.assertRaises(ValueError):
+                set_shutdown_budget(DRAIN, -1)
+
+        self.shutdown(setup)
+
+
+if __name__ == "__main__":
+    unittest.main()
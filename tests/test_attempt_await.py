@@ -0,0 +1,66 @@
+# Internal
+import asyncio
+import unittest
+import contextvars
+from unittest.mock import patch
+
+# External
+import asynctest
+
+from async_tools import maybe_await, attempt_await
+
+var: "contextvars.ContextVar[str]" = contextvars.ContextVar("var", default="caller")
+
+
+class Awaitable:
+    def __await__(self):
+        yield from asyncio.sleep(0).__await__()
+        return "awaitable"
+
+
+class AttemptAwaitTestCase(asynctest.TestCase, unittest.TestCase):
+    async def test_attempt_await(self):
+        async def coro():
+            await asyncio.sleep(0)
+            return "coroutine"
+
+        fut = self.loop.create_future()
+        self.loop.call_soon(fut.set_result, "future")
+
+        self.assertEqual(await attempt_await(coro()), "coroutine")
+        self.assertEqual(await attempt_await(fut), "future")
+        self.assertEqual(await attempt_await(Awaitable()), "awaitable")
+        self.assertEqual(await attempt_await("value"), "value")
+        self.assertIsNone(await attempt_await(None))
+
+    async def test_no_task(self):
+        async def coro():
+            return "coroutine"
+
+        with patch.object(self.loop, "create_task") as create_task:
+            self.assertEqual(await attempt_await(coro()), "coroutine")
+            create_task.assert_not_called()
+
+    async def test_context(self):
+        async def change():
+            var.set("callee")
+            return await asyncio.sleep(0, var.get())
+
+        # Run inline, in the caller's context
+        self.assertEqual(await attempt_await(change()), "callee")
+        self.assertEqual(var.get(), "callee")
+
+    async def test_maybe_await(self):
+        fut = self.loop.create_future()
+        self.assertIs(maybe_await(fut), fut)
+        fut.cancel()
+
+        self.assertEqual(await maybe_await([1]), [1])
+
+    async def test_deprecated_loop(self):
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(await attempt_await("value", self.loop), "value")
+
+
+if __name__ == "__main__":
+    unittest.main()
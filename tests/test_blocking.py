@@ -1,14 +1,17 @@
 # Standard
 from asyncio import gather
 from inspect import isawaitable
+from threading import Barrier, Thread, current_thread
 from concurrent.futures.thread import ThreadPoolExecutor
 from concurrent.futures.process import ProcessPoolExecutor
+import os
 import typing as T
 import unittest
 import multiprocessing
 
 # External
 from async_tools.decorator.blocking import thread, process
+from async_tools.decorator.shared_cache import SharedResultCache
 import asynctest
 
 PI = "3.141592653589793238462643383279502884197169399375105820974944592307816406286208998628034825342117070"
@@ -68,6 +71,11 @@ def test_process_multi(precision=100):
     return str(calculate_pi(precision))
 
 
+@process(2, cache=SharedResultCache(2**20))
+def test_process_cached(precision=100):
+    return os.getpid(), str(calculate_pi(precision))
+
+
 class BlockingTestCase(asynctest.TestCase, unittest.TestCase):
     def test_sync_thread(self):
         self.assertEqual(test_thread(), PI)
@@ -166,6 +174,62 @@ class BlockingTestCase(asynctest.TestCase, unittest.TestCase):
 
         self.assertEqual(await awaitable, PI_80)
 
+    async def test_async_thread_int_uses_own_executor(self):
+        @thread(2)
+        def thread_name():
+            return current_thread().name
+
+        name = await thread_name()
+
+        self.assertTrue(name.startswith(thread_name.__decorator__.executor._thread_name_prefix))
+
+    async def test_executor_lazy_init_threads(self):
+        decorator = thread(4)(calculate_pi).__decorator__
+        barrier = Barrier(8)
+        executors = []
+
+        def get_executor():
+            barrier.wait()
+            executors.append(decorator.executor)
+
+        threads = [Thread(target=get_executor) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(executors), 8)
+        for executor in executors:
+            self.assertIs(executor, decorator.executor)
+
+    async def test_async_process_cached(self):
+        pid, result = await test_process_cached(80)
+
+        self.assertNotEqual(pid, os.getpid())
+        self.assertEqual(result, PI_80)
+        self.assertEqual(await test_process_cached(80), (pid, PI_80))
+
+    def test_shared_result_cache_eviction(self):
+        cache = SharedResultCache(4096 * 2, slot_size=4096, ways=2)
+        cache.bind_id(calculate_pi)
+        cache.open()
+        self.addCleanup(cache.close)
+
+        digests = [cache.digest(calculate_pi, (i,), {}) for i in range(3)]
+        self.assertTrue(cache.put(digests[0], 0))
+        self.assertTrue(cache.put(digests[1], 1))
+
+        # Reads don't write to the arena, only the parent's put does
+        arena = bytes(cache._shm.buf)
+        self.assertEqual(cache.get(digests[0], None), 0)
+        self.assertEqual(bytes(cache._shm.buf), arena)
+        self.assertTrue(cache.put(digests[2], 2))
+
+        self.assertEqual(cache.get(digests[0], None), 0)
+        self.assertIsNone(cache.get(digests[1], None))
+        self.assertEqual(cache.get(digests[2], None), 2)
+        self.assertFalse(cache.put(digests[1], "x" * 4096))
+
     async def test_async_thread_80_kwargs(self):
         awaitable = test_thread(precision=80)
 
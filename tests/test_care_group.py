@@ -0,0 +1,101 @@
+# Internal
+import math
+import asyncio
+import inspect
+import unittest
+
+# External
+import asynctest
+
+from async_tools import CareGroup
+
+
+class CareGroupTestCase(asynctest.TestCase, unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop_exception = None
+
+        self.loop.set_exception_handler(
+            lambda loop, context: setattr(self, "loop_exception", context)
+        )
+
+    async def test_join(self):
+        results = []
+
+        async def job(i):
+            await asyncio.sleep(0)
+            if i < 3:
+                group.spawn(job(i + 10))
+            results.append(i)
+
+        async with CareGroup() as group:
+            for i in range(3):
+                group.spawn(job(i))
+            self.assertEqual(len(group), 3)
+
+            await group.join()
+            self.assertEqual(len(group), 0)
+
+        self.assertEqual(sorted(results), [0, 1, 2, 10, 11, 12])
+
+        with self.assertRaises(RuntimeError):
+            group.spawn(job(0))
+
+    async def test_error_reported(self):
+        async def fail():
+            raise Exception("--Test Error--")
+
+        async with CareGroup() as group:
+            group.spawn(fail())
+            other = group.spawn(asyncio.sleep(0.01))
+            await group.join()
+
+        self.assertTrue(other.done() and not other.cancelled())
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            raise self.loop_exception["exception"]
+
+    async def test_raise_first_error(self):
+        async def fail():
+            await asyncio.sleep(0)
+            raise Exception("--Test Error--")
+
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            async with CareGroup(raise_first_error=True) as group:
+                other = group.spawn(asyncio.sleep(10))
+                group.spawn(fail())
+                await group.join()
+
+        self.assertTrue(other.cancelled())
+        self.assertIsNone(self.loop_exception)
+
+    async def test_exit_cancels_and_drains(self):
+        stubborn_release = asyncio.Event()
+
+        async def stubborn():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await stubborn_release.wait()
+
+        async with CareGroup(drain_timeout=0.01) as group:
+            polite = group.spawn(asyncio.sleep(10))
+            group.spawn(stubborn())
+            await asyncio.sleep(0)
+
+        self.assertTrue(polite.cancelled())
+        self.assertEqual(len(group), 1)
+        self.assertIn("didn't finish in time", self.loop_exception["message"])
+
+        stubborn_release.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        self.assertEqual(len(group), 0)
+
+    async def test_default_drain_timeout(self):
+        # Exiting is bounded even without an explicit drain_timeout
+        default = inspect.signature(CareGroup).parameters["drain_timeout"].default
+        self.assertIsNotNone(default)
+        self.assertTrue(math.isfinite(default))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Internal
+import time
+import asyncio
+import unittest
+import threading
+from concurrent.futures.thread import ThreadPoolExecutor
+from concurrent.futures.process import ProcessPoolExecutor
+
+# External
+import asynctest
+
+from async_tools import drain_executor, drain_executors, shutdown_default_executor
+from async_tools.decorator import thread
+from async_tools.drain_executors import _cancel_queued
+
+
+@thread(1)
+def blocking_echo(value):
+    return value
+
+
+@thread
+def default_echo(value):
+    return value
+
+
+class DrainExecutorsTestCase(asynctest.TestCase, unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop_exceptions = []
+        self.loop.set_exception_handler(lambda loop, context: self.loop_exceptions.append(context))
+
+    async def test_drain(self):
+        executor = ThreadPoolExecutor(1)
+        fut = self.loop.run_in_executor(executor, time.sleep, 0.01)
+
+        self.assertTrue(await drain_executor(executor, timeout=1))
+        self.assertTrue(fut.done())
+        self.assertEqual(self.loop_exceptions, [])
+
+    async def test_drain_stuck_thread(self):
+        release = threading.Event()
+        executor = ThreadPoolExecutor(1)
+        running = self.loop.run_in_executor(executor, release.wait)
+        queued = self.loop.run_in_executor(executor, time.sleep, 0)
+        await asyncio.sleep(0.01)
+
+        try:
+            self.assertFalse(await drain_executor(executor, timeout=0.01))
+        finally:
+            release.set()
+
+        self.assertTrue(queued.cancelled())
+        (context,) = self.loop_exceptions
+        self.assertEqual(len(context["stragglers"]), 1)
+        self.assertIs(context["executor"], executor)
+        await running
+
+    async def test_cancel_queued(self):
+        # Python 3.8 fallback for shutdown's cancel_futures
+        release = threading.Event()
+        executor = ThreadPoolExecutor(1)
+        running = self.loop.run_in_executor(executor, release.wait)
+        queued = self.loop.run_in_executor(executor, time.sleep, 0)
+        await asyncio.sleep(0.01)
+
+        _cancel_queued(executor)
+        release.set()
+        await running
+        executor.shutdown(wait=True)
+
+        await asyncio.sleep(0)
+        self.assertTrue(queued.cancelled())
+
+    async def test_drain_stuck_process(self):
+        executor = ProcessPoolExecutor(1)
+        running = self.loop.run_in_executor(executor, time.sleep, 10)
+        await asyncio.sleep(0.5)
+
+        self.assertFalse(await drain_executor(executor, timeout=0.01))
+
+        (context,) = self.loop_exceptions
+        (process,) = context["stragglers"]
+        process.join(1)
+        self.assertFalse(process.is_alive())
+        with self.assertRaises(Exception):
+            await running
+
+    async def test_drain_decorators(self):
+        self.assertEqual(await blocking_echo(1), 1)
+        executor = blocking_echo.__decorator__._executor
+        self.assertIsNotNone(executor)
+
+        self.assertTrue(await drain_executors(timeout=1))
+        self.assertIsNone(blocking_echo.__decorator__._executor)
+
+        # A new executor is created on demand
+        self.assertEqual(await blocking_echo(2), 2)
+        self.assertIsNot(blocking_echo.__decorator__._executor, executor)
+
+    async def test_drain_default_executor(self):
+        self.assertEqual(await default_echo(1), 1)
+        executor = self.loop._default_executor
+        self.assertIsNotNone(executor)
+
+        self.assertTrue(await drain_executors(timeout=1))
+        # The loop creates a new default executor on demand
+        self.assertEqual(await default_echo(2), 2)
+        self.assertIsNot(self.loop._default_executor, executor)
+
+        await shutdown_default_executor(timeout=1)
+        self.assertEqual(await default_echo(3), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Internal
+import asyncio
+import unittest
+import contextvars
+from unittest.mock import patch
+
+# External
+import asynctest
+
+from async_tools import eager_task, wait_with_care
+
+var: "contextvars.ContextVar[str]" = contextvars.ContextVar("var", default="caller")
+
+
+class EagerTaskTestCase(asynctest.TestCase, unittest.TestCase):
+    async def test_synchronous(self):
+        async def cached():
+            return "hit"
+
+        with patch.object(self.loop, "call_soon") as call_soon:
+            fut = eager_task(cached())
+            self.assertTrue(fut.done())
+            call_soon.assert_not_called()
+
+        self.assertEqual(fut.result(), "hit")
+
+    async def test_synchronous_error(self):
+        async def fail():
+            raise ValueError("--Test Error--")
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        fut = eager_task(fail())
+        with self.assertRaisesRegex(ValueError, "--Test Error--"):
+            fut.result()
+
+        self.assertTrue(eager_task(cancelled()).cancelled())
+
+    async def test_suspending(self):
+        steps = []
+
+        async def miss():
+            steps.append("start")
+            await asyncio.sleep(0)
+            steps.append("resumed")
+            await asyncio.sleep(0.01)
+            return "miss"
+
+        fut = eager_task(miss())
+        self.assertEqual(steps, ["start"])
+        self.assertFalse(fut.done())
+
+        self.assertEqual(await fut, "miss")
+        self.assertEqual(steps, ["start", "resumed"])
+
+    async def test_suspending_cancel(self):
+        cleanup = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cleanup.append(True)
+                raise
+
+        fut = eager_task(slow())
+        await asyncio.sleep(0)
+        fut.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await fut
+        self.assertEqual(cleanup, [True])
+
+    async def test_context(self):
+        async def change():
+            var.set("task")
+            await asyncio.sleep(0)
+            return var.get()
+
+        self.assertEqual(await eager_task(change()), "task")
+        self.assertEqual(var.get(), "caller")
+
+    async def test_wait_with_care_eager(self):
+        async def cached():
+            return "hit"
+
+        async def miss():
+            await asyncio.sleep(0.01)
+            return "miss"
+
+        with patch.object(self.loop, "call_soon") as call_soon:
+            done, pending = await wait_with_care(cached(), cached(), eager=True)
+            call_soon.assert_not_called()
+
+        self.assertEqual(len(done), 2)
+        self.assertEqual(len(pending), 0)
+
+        done, pending = await wait_with_care(cached(), miss(), eager=True)
+        self.assertEqual({fut.result() for fut in done}, {"hit", "miss"})
+
+        done, pending = await wait_with_care(iter([cached(), miss()]), limit=1, eager=True)
+        self.assertEqual({fut.result() for fut in done}, {"hit", "miss"})
+
+
+if __name__ == "__main__":
+    unittest.main()
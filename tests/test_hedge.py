@@ -0,0 +1,110 @@
+# Internal
+import asyncio
+import unittest
+
+# External
+import asynctest
+
+from async_tools import LatencyQuantile, hedge
+
+
+class HedgeTestCase(asynctest.TestCase, unittest.TestCase):
+    async def test_fast_attempt(self):
+        attempts = []
+
+        async def request():
+            attempts.append(1)
+            return "done"
+
+        self.assertEqual(await hedge(request, delay=0.1), "done")
+        self.assertEqual(len(attempts), 1)
+
+    async def test_backup_wins(self):
+        latencies = [10, 0.01]
+        attempts = []
+
+        async def request():
+            latency = latencies[len(attempts)]
+            attempt = self.loop.create_task(asyncio.sleep(latency, latency))
+            attempts.append(attempt)
+            return await attempt
+
+        result = await asyncio.wait_for(hedge(request, delay=0.01), 1)
+
+        self.assertEqual(result, 0.01)
+        self.assertEqual(len(attempts), 2)
+        # The slow attempt was cancelled and cleaned up
+        self.assertTrue(attempts[0].cancelled())
+
+    async def test_failures(self):
+        attempts = []
+
+        async def request():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ValueError(len(attempts))
+            return "done"
+
+        self.assertEqual(await hedge(request, delay=10, max_attempts=3), "done")
+
+        attempts.clear()
+        with self.assertRaisesRegex(ValueError, "2"):
+            await hedge(request, delay=10, max_attempts=2)
+
+        with self.assertRaises(ValueError):
+            await hedge(request, delay=10, max_attempts=0)
+
+    async def test_cancelled(self):
+        attempt = self.loop.create_future()
+
+        async def request():
+            return await attempt
+
+        task = self.loop.create_task(hedge(request, delay=10, max_attempts=1))
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertTrue(attempt.cancelled())
+
+    async def test_latency_quantile(self):
+        quantile = LatencyQuantile(0.9, window=10, initial=1, min_samples=5)
+        self.assertEqual(quantile.value, 1)
+
+        for latency in range(20):
+            quantile.observe(latency)
+
+        self.assertEqual(len(quantile), 10)
+        self.assertEqual(quantile.value, 19)
+
+        async def request():
+            return "done"
+
+        self.assertEqual(await hedge(request, delay=quantile), "done")
+        self.assertEqual(len(quantile), 10)
+        # The winner latency replaced the oldest observation
+        self.assertLess(quantile._sorted[0], 1)
+        self.assertEqual(quantile._sorted[1:], list(range(11, 20)))
+
+        with self.assertRaises(ValueError):
+            LatencyQuantile(2)
+
+    async def test_latency_quantile_backup_wins(self):
+        quantile = LatencyQuantile(initial=0.05)
+        latencies = [10, 0.001]
+        attempts = []
+
+        async def request():
+            latency = latencies[len(attempts)]
+            attempts.append(latency)
+            return await asyncio.sleep(latency, latency)
+
+        self.assertEqual(await asyncio.wait_for(hedge(request, delay=quantile), 1), 0.001)
+        # The slow primary took at least the delay, not just the backup latency
+        (latency,) = quantile._sorted
+        self.assertGreaterEqual(latency, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,33 @@
 # Internal
 import asyncio
+import tempfile
 import unittest
 from asyncio import get_running_loop
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 # External
 import asynctest
 
-from async_tools.lock import ReadLock, WriteLock, AsyncLockStack
+from async_tools.lock import (
+    FIFO,
+    ACQUIRED,
+    RELEASED,
+    CANCELLED,
+    PHASE_FAIR,
+    READER_PREFERRING,
+    WRITER_PREFERRING,
+    Latch,
+    Barrier,
+    Permits,
+    RCUCell,
+    ReadLock,
+    WriteLock,
+    AsyncLockStack,
+    BroadcastEvent,
+    AsyncFileLockStack,
+    UpgradableReadLock,
+    AsyncKeyedLockStack,
+)
 
 
 @asynctest.strict
@@ -55,6 +75,730 @@ class LockTestCase(asynctest.TestCase, unittest.TestCase):
         read_mock.assert_has_calls([call(1), call(1)])
         write_mock.assert_called_once_with(1)
 
+    async def test_fifo_order(self):
+        lock = AsyncLockStack()
+        future = self.loop.create_future()
+        order = []
+
+        async def hold():
+            async with lock(WriteLock):
+                await future
+
+        async def acquire(name, lock_type):
+            async with lock(lock_type):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        holder = self.loop.create_task(hold())
+        await asyncio.sleep(0)
+
+        tasks = [
+            self.loop.create_task(acquire(name, lock_type))
+            for name, lock_type in (
+                ("w1", WriteLock),
+                ("r1", ReadLock),
+                ("r2", ReadLock),
+                ("w2", WriteLock),
+                ("r3", ReadLock),
+            )
+        ]
+        await asyncio.sleep(0)
+
+        future.set_result(None)
+        await asyncio.gather(holder, *tasks)
+
+        self.assertEqual(order, ["w1", "r1", "r2", "w2", "r3"])
+
+    async def test_cancelled_head_does_not_block(self):
+        lock = AsyncLockStack()
+        read_mock = Mock()
+
+        async def read():
+            async with lock(ReadLock):
+                read_mock(1)
+
+        async with lock(ReadLock):
+            write_task = self.loop.create_task(lock(WriteLock).__aenter__())
+            await asyncio.sleep(0)
+            read_task = self.loop.create_task(read())
+            await asyncio.sleep(0)
+            read_mock.assert_not_called()
+
+            write_task.cancel()
+            await asyncio.sleep(0)
+            await asyncio.wait_for(read_task, 1)
+
+        read_mock.assert_called_once_with(1)
+
+    async def _grant_order(self, lock, held, queued):
+        future = self.loop.create_future()
+        order = []
+
+        async def hold():
+            async with lock(held):
+                await future
+
+        async def acquire(name, lock_type):
+            async with lock(lock_type):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        holder = self.loop.create_task(hold())
+        await asyncio.sleep(0)
+
+        tasks = []
+        for name, lock_type in queued:
+            tasks.append(self.loop.create_task(acquire(name, lock_type)))
+            await asyncio.sleep(0)
+
+        future.set_result(None)
+        await asyncio.gather(holder, *tasks)
+
+        return order
+
+    async def test_policies_after_write(self):
+        queued = (("r1", ReadLock), ("r2", ReadLock), ("w1", WriteLock), ("r3", ReadLock))
+        expected = {
+            FIFO: ["r1", "r2", "w1", "r3"],
+            READER_PREFERRING: ["r1", "r2", "r3", "w1"],
+            WRITER_PREFERRING: ["w1", "r1", "r2", "r3"],
+            PHASE_FAIR: ["r1", "r2", "r3", "w1"],
+        }
+
+        for policy, order in expected.items():
+            with self.subTest(policy=policy):
+                lock = AsyncLockStack(policy=policy)
+                self.assertEqual(await self._grant_order(lock, WriteLock, queued), order)
+
+    async def test_policies_after_read(self):
+        queued = (("w1", WriteLock), ("r1", ReadLock), ("w2", WriteLock), ("r2", ReadLock))
+        expected = {
+            FIFO: ["w1", "r1", "w2", "r2"],
+            READER_PREFERRING: ["r1", "r2", "w1", "w2"],
+            WRITER_PREFERRING: ["w1", "w2", "r1", "r2"],
+            PHASE_FAIR: ["w1", "r1", "r2", "w2"],
+        }
+
+        for policy, order in expected.items():
+            with self.subTest(policy=policy):
+                lock = AsyncLockStack(policy=policy)
+                self.assertEqual(await self._grant_order(lock, ReadLock, queued), order)
+
+    async def test_uncontended_fast_path(self):
+        lock = AsyncLockStack()
+
+        self.assertIs(lock(ReadLock), lock(ReadLock))
+
+        with patch.object(self.loop, "create_future", wraps=self.loop.create_future) as factory:
+            async with lock(ReadLock):
+                async with lock(ReadLock):
+                    pass
+
+            async with lock(WriteLock):
+                pass
+
+            factory.assert_not_called()
+
+    async def test_cancel_after_grant(self):
+        lock = AsyncLockStack()
+        read_mock = Mock()
+
+        async def read():
+            async with lock(ReadLock):
+                read_mock(1)
+
+        async with lock(WriteLock):
+            read_task = self.loop.create_task(read())
+            await asyncio.sleep(0)
+
+        # Lock was granted to read_task, but it is cancelled before resuming
+        read_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await read_task
+
+        read_mock.assert_not_called()
+        async with lock(WriteLock):
+            pass
+
+    async def test_cancelled_waiters_removed(self):
+        lock = AsyncLockStack()
+
+        async with lock(WriteLock):
+            tasks = [self.loop.create_task(lock(ReadLock).__aenter__()) for _ in range(10)]
+            await asyncio.sleep(0)
+            self.assertEqual(len(lock._locks[ReadLock]), 10)
+
+            for task in tasks[1:-1]:
+                task.cancel()
+            await asyncio.gather(*tasks[1:-1], return_exceptions=True)
+            self.assertEqual(len(lock._locks[ReadLock]), 2)
+
+        await asyncio.gather(tasks[0], tasks[-1])
+        await lock(ReadLock).__aexit__(None, None, None)
+        await lock(ReadLock).__aexit__(None, None, None)
+        self.assertTrue(lock.idle)
+
+    async def test_acquire_timeout(self):
+        lock = AsyncLockStack()
+        read_mock = Mock()
+
+        async def read():
+            async with lock(ReadLock):
+                read_mock(1)
+
+        async with lock(ReadLock, timeout=0.01):
+            pass
+
+        async with lock(WriteLock):
+            read_task = self.loop.create_task(read())
+            await asyncio.sleep(0)
+
+            with self.assertRaises(asyncio.TimeoutError):
+                async with lock(WriteLock, timeout=0.01):
+                    pass
+
+            self.assertEqual(len(lock._locks), 1)
+
+        await asyncio.wait_for(read_task, 1)
+        read_mock.assert_called_once_with(1)
+        self.assertTrue(lock.idle)
+
+    async def test_priority(self):
+        lock = AsyncLockStack(prioritized=True, aging=10)
+        order = []
+
+        async def acquire(name, priority):
+            async with lock(WriteLock, priority=priority):
+                order.append(name)
+
+        async with lock(WriteLock):
+            tasks = []
+            for name, priority in (("bulk1", 0), ("health", 5), ("bulk2", 0), ("control", 2)):
+                tasks.append(self.loop.create_task(acquire(name, priority)))
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        self.assertEqual(order, ["health", "control", "bulk1", "bulk2"])
+
+        with self.assertRaises(ValueError):
+            AsyncLockStack()(WriteLock, priority=1)
+
+    async def test_priority_aging(self):
+        lock = AsyncLockStack(prioritized=True, aging=0.01)
+        order = []
+
+        async def acquire(name, priority):
+            async with lock(WriteLock, priority=priority):
+                order.append(name)
+
+        async with lock(WriteLock):
+            tasks = [self.loop.create_task(acquire("bulk", 0))]
+            await asyncio.sleep(0.05)
+            tasks.append(self.loop.create_task(acquire("control", 1)))
+            tasks.append(self.loop.create_task(acquire("cancelled", 1)))
+            await asyncio.sleep(0)
+            tasks.pop().cancel()
+
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        # bulk waited longer than the one priority level control has over it
+        self.assertEqual(order, ["bulk", "control"])
+        self.assertTrue(lock.idle)
+
+    async def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            AsyncLockStack(policy="LIFO")
+
+    async def test_keyed_lock(self):
+        lock = AsyncKeyedLockStack()
+        future = self.loop.create_future()
+        write_mock = Mock()
+
+        async def write(key):
+            async with lock(key, WriteLock):
+                write_mock(key)
+                await future
+
+        first = self.loop.create_task(write("a"))
+        second = self.loop.create_task(write("a"))
+        other = self.loop.create_task(write("b"))
+        await asyncio.sleep(0)
+
+        write_mock.assert_has_calls([call("a"), call("b")])
+        self.assertEqual(write_mock.call_count, 2)
+        self.assertEqual(len(lock), 2)
+
+        future.set_result(None)
+        await asyncio.gather(first, second, other)
+
+        self.assertEqual(write_mock.call_count, 3)
+        self.assertEqual(len(lock), 0)
+
+    async def test_keyed_lock_evict_cancelled(self):
+        lock = AsyncKeyedLockStack()
+
+        async with lock("a", WriteLock):
+            waiter = self.loop.create_task(lock("a", ReadLock).__aenter__())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            self.assertEqual(len(lock), 1)
+
+        self.assertEqual(len(lock), 0)
+
+    async def test_keyed_lock_atomic(self):
+        lock = AsyncKeyedLockStack()
+        order = []
+
+        async def transfer(name, source, target):
+            async with lock.atomic({source: WriteLock, target: WriteLock}):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        with patch.object(self.loop, "create_future", wraps=self.loop.create_future) as factory:
+            async with lock.atomic({"a": WriteLock, "b": ReadLock}):
+                pass
+            factory.assert_not_called()
+        self.assertEqual(len(lock), 0)
+
+        async with lock("a", ReadLock):
+            tasks = [
+                self.loop.create_task(transfer("ab", "a", "b")),
+                self.loop.create_task(transfer("ba", "b", "a")),
+                self.loop.create_task(transfer("bc", "b", "c")),
+            ]
+            await asyncio.sleep(0)
+            # Nothing is held until a whole group can be granted
+            self.assertEqual(order, [])
+            self.assertEqual(lock._stacks["b"]._vault[WriteLock], 0)
+            async with lock("d", WriteLock, timeout=1):
+                pass
+
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        self.assertEqual(order, ["ab", "ba", "bc"])
+        self.assertEqual(len(lock), 0)
+
+        async with lock("a", WriteLock):
+            with self.assertRaises(asyncio.TimeoutError):
+                async with lock.atomic({"a": ReadLock, "b": WriteLock}, timeout=0.01):
+                    pass
+            self.assertEqual(len(lock), 1)
+
+        self.assertEqual(len(lock), 0)
+
+        with self.assertRaises(ValueError):
+            AsyncKeyedLockStack(policy=PHASE_FAIR).atomic({"a": WriteLock})
+
+    async def test_keyed_lock_atomic_stripes(self):
+        lock = AsyncKeyedLockStack(stripes=1)
+
+        async with lock.atomic({"a": ReadLock, "b": WriteLock}):
+            self.assertTrue(lock("c", ReadLock) is lock("c", ReadLock))
+            reader = self.loop.create_task(lock("c", ReadLock).__aenter__())
+            await asyncio.sleep(0)
+            self.assertFalse(reader.done())
+
+        await asyncio.wait_for(reader, 1)
+        await lock("c", ReadLock).__aexit__(None, None, None)
+
+    async def test_keyed_lock_atomic_stripe_collision(self):
+        class Slots(Permits, capacity=3):
+            pass
+
+        lock = AsyncKeyedLockStack(stripes=1)
+
+        # Both weights are taken from the shared stripe
+        async with lock.atomic({"a": Slots(1), "b": Slots(2)}):
+            waiter = self.loop.create_task(lock("c", Slots).__aenter__())
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+
+        await asyncio.wait_for(waiter, 1)
+        await lock("c", Slots).__aexit__(None, None, None)
+
+        with self.assertRaises(ValueError):
+            await lock.atomic({"a": Slots(2), "b": Slots(2)}).__aenter__()
+
+        for locks in ({"a": WriteLock, "b": Slots}, {"a": Slots, "b": Permits}):
+            with self.assertRaises(ValueError):
+                await lock.atomic(locks).__aenter__()
+
+    async def test_keyed_lock_stripes(self):
+        lock = AsyncKeyedLockStack(stripes=4)
+        self.assertEqual(len(lock), 4)
+
+        async with lock(1, WriteLock):
+            async with lock(2, WriteLock):
+                pass
+
+        self.assertIs(lock(1, ReadLock), lock(5, ReadLock))
+        self.assertEqual(len(lock), 4)
+
+        with self.assertRaises(ValueError):
+            AsyncKeyedLockStack(stripes=0)
+
+    async def test_instrumentation(self):
+        events = []
+        lock = AsyncLockStack(hook=lambda *event: events.append(event[:2]))
+
+        with self.assertRaises(RuntimeError):
+            AsyncLockStack().stats()
+
+        self.assertIsNone(lock.longest_holder())
+
+        async def read():
+            async with lock(ReadLock):
+                pass
+
+        async with lock(WriteLock):
+            reader = self.loop.create_task(read())
+            cancelled = self.loop.create_task(read())
+            await asyncio.sleep(0.01)
+
+            holder = lock.longest_holder()
+            self.assertIs(holder.lock_type, WriteLock)
+            self.assertIs(holder.task, asyncio.current_task())
+            self.assertGreater(holder.held, 0)
+
+            stats = lock.stats()
+            self.assertEqual(stats[WriteLock].holding, 1)
+            self.assertEqual(stats[WriteLock].acquisitions, 1)
+            self.assertEqual(stats[WriteLock].contended, 0)
+
+            cancelled.cancel()
+            await asyncio.sleep(0)
+
+        await reader
+
+        stats = lock.stats()
+        self.assertEqual(stats[ReadLock].acquisitions, 1)
+        self.assertEqual(stats[ReadLock].contended, 1)
+        self.assertEqual(stats[ReadLock].cancelled, 1)
+        self.assertEqual(stats[ReadLock].max_waiting, 2)
+        self.assertEqual(stats[ReadLock].holding, 0)
+        self.assertGreater(stats[ReadLock].wait_max, 0)
+        self.assertGreater(stats[WriteLock].hold_max, 0)
+        self.assertIsNone(lock.longest_holder())
+        self.assertEqual(
+            events,
+            [
+                (ACQUIRED, WriteLock),
+                (CANCELLED, ReadLock),
+                (RELEASED, WriteLock),
+                (ACQUIRED, ReadLock),
+                (RELEASED, ReadLock),
+            ],
+        )
+
+    async def test_permits(self):
+        class Budget(Permits, capacity=10):
+            pass
+
+        lock = AsyncLockStack()
+        order = []
+        release = self.loop.create_future()
+
+        async def job(name, weight):
+            async with lock(Budget(weight)):
+                order.append(name)
+                await release
+
+        tasks = [
+            self.loop.create_task(job(name, weight))
+            for name, weight in (("a", 4), ("b", 5), ("c", 3), ("d", 1))
+        ]
+        await asyncio.sleep(0)
+
+        # c doesn't fit, and d must wait behind it
+        self.assertEqual(order, ["a", "b"])
+        self.assertEqual(lock._vault[Budget], 9)
+
+        release.set_result(None)
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(order, ["a", "b", "c", "d"])
+        self.assertTrue(lock.idle)
+
+    async def test_permits_counting(self):
+        class Slots(Permits, capacity=2):
+            pass
+
+        lock = AsyncLockStack()
+        async with lock(Slots):
+            async with lock(Slots):
+                waiter = self.loop.create_task(lock(Slots).__aenter__())
+                await asyncio.sleep(0)
+                self.assertFalse(waiter.done())
+
+            await asyncio.sleep(0)
+            self.assertTrue(waiter.done())
+            await lock(Slots).__aexit__(None, None, None)
+
+        self.assertTrue(lock.idle)
+
+        with self.assertRaises(ValueError):
+            Slots(3)
+
+        with self.assertRaises(ValueError):
+
+            class Invalid(Permits, capacity=0):
+                pass
+
+    async def test_upgradable_read_lock(self):
+        lock = AsyncLockStack()
+        order = []
+
+        async def acquire(name, lock_type):
+            async with lock(lock_type):
+                order.append(name)
+
+        async with lock(UpgradableReadLock):
+            async with lock(ReadLock):
+                pass
+
+            reader = self.loop.create_task(lock(ReadLock).__aenter__())
+            await asyncio.sleep(0)
+            self.assertTrue(reader.done())
+
+            tasks = [
+                self.loop.create_task(acquire(name, lock_type))
+                for name, lock_type in (("w1", WriteLock), ("u1", UpgradableReadLock))
+            ]
+            upgrade = lock.upgrade()
+            upgrade_task = self.loop.create_task(upgrade.__aenter__())
+            await asyncio.sleep(0)
+            self.assertFalse(upgrade_task.done())
+
+            # No new readers once an upgrade is pending
+            tasks.append(self.loop.create_task(acquire("r1", ReadLock)))
+            await asyncio.sleep(0)
+
+            await lock(ReadLock).__aexit__(None, None, None)
+            await asyncio.wait_for(upgrade_task, 1)
+            self.assertEqual(lock._vault[WriteLock], 1)
+            self.assertEqual(order, [])
+            await upgrade.__aexit__(None, None, None)
+
+            # FIFO: r1 stays queued behind w1, which waits for the UpgradableReadLock release
+            await asyncio.sleep(0)
+            self.assertEqual(order, [])
+
+            async with lock.upgrade():
+                self.assertEqual(lock._vault[WriteLock], 1)
+
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        self.assertEqual(order, ["w1", "u1", "r1"])
+        self.assertTrue(lock.idle)
+
+        with self.assertRaises(RuntimeError):
+            async with lock.upgrade():
+                pass
+
+    async def test_upgrade_timeout(self):
+        lock = AsyncLockStack()
+
+        async with lock(UpgradableReadLock):
+            reader = self.loop.create_task(lock(ReadLock).__aenter__())
+            await asyncio.sleep(0)
+
+            with self.assertRaises(asyncio.TimeoutError):
+                async with lock.upgrade(timeout=0.01):
+                    pass
+
+            async with lock(ReadLock):
+                pass
+
+            await lock(ReadLock).__aexit__(None, None, None)
+            async with lock.upgrade():
+                pass
+
+        await reader
+        self.assertTrue(lock.idle)
+
+    async def test_rcu_cell(self):
+        cell = RCUCell({"route": 1})
+        self.assertEqual(cell.value, {"route": 1})
+
+        async def bump(value):
+            await asyncio.sleep(0)
+            return {"route": value["route"] + 1}
+
+        results = await asyncio.gather(*(cell.update(bump) for _ in range(5)))
+        self.assertEqual(results[-1], {"route": 6})
+        self.assertEqual(cell.version, 5)
+
+        with cell.read() as snapshot:
+            await cell.set({"route": 0})
+            self.assertEqual(snapshot, {"route": 6})
+            self.assertEqual(cell.value, {"route": 0})
+
+            grace = self.loop.create_task(cell.set({"route": -1}, wait_readers=True))
+            await asyncio.sleep(0.01)
+            self.assertFalse(grace.done())
+            self.assertEqual(cell.value, {"route": -1})
+
+        await asyncio.wait_for(grace, 1)
+        self.assertFalse(cell._readers)
+        await asyncio.wait_for(cell.synchronize(), 1)
+
+    async def test_rcu_cell_synchronize_cancel(self):
+        cell = RCUCell(0)
+        reading = cell.read()
+        await cell.set(1)
+
+        # The snapshot is taken on enter, not when read() is called
+        with reading as snapshot:
+            self.assertEqual(snapshot, 1)
+            await cell.set(2)
+
+            cancelled = self.loop.create_task(cell.synchronize())
+            waiter = self.loop.create_task(cell.synchronize())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+
+        await asyncio.wait_for(waiter, 1)
+        self.assertTrue(cancelled.cancelled())
+
+    async def test_broadcast_event(self):
+        event = BroadcastEvent()
+        waiters = [self.loop.create_task(event.wait()) for _ in range(100)]
+        await asyncio.sleep(0)
+        self.assertFalse(any(waiter.done() for waiter in waiters))
+
+        # Waiters await the same future, no per waiter wrapping
+        self.assertEqual(len({waiter._fut_waiter for waiter in waiters}), 1)
+
+        # Cancelling a waiter doesn't affect the others
+        cancelled = waiters.pop()
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        self.assertTrue(cancelled.cancelled())
+        self.assertFalse(any(waiter.done() for waiter in waiters))
+        self.assertEqual(len({waiter._fut_waiter for waiter in waiters}), 1)
+
+        with patch.object(self.loop, "create_future", wraps=self.loop.create_future) as factory:
+            event.set()
+            await event.wait()
+            factory.assert_not_called()
+
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+
+        self.assertTrue(event.is_set())
+        event.clear()
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(event.wait(), 0.01)
+
+    async def test_latch(self):
+        latch = Latch(3)
+        waiters = [self.loop.create_task(latch.wait()) for _ in range(10)]
+        await asyncio.sleep(0)
+
+        latch.count_down()
+        latch.count_down()
+        await asyncio.sleep(0)
+        self.assertEqual(latch.count, 1)
+        self.assertFalse(any(waiter.done() for waiter in waiters))
+
+        latch.count_down()
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+        await latch.wait()
+
+        with self.assertRaises(ValueError):
+            Latch(-1)
+
+        latch = Latch(2)
+        for n in (0, -1):
+            with self.assertRaises(ValueError):
+                latch.count_down(n)
+        self.assertEqual(latch.count, 2)
+
+    async def test_barrier(self):
+        barrier = Barrier(3)
+
+        cancelled = self.loop.create_task(barrier.wait())
+        await asyncio.sleep(0)
+        self.assertEqual(barrier.waiting, 1)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        self.assertEqual(barrier.waiting, 0)
+
+        for _ in range(2):
+            indexes = await asyncio.wait_for(
+                asyncio.gather(*(barrier.wait() for _ in range(3))), 1
+            )
+            self.assertEqual(sorted(indexes), [0, 1, 2])
+            self.assertEqual(barrier.waiting, 0)
+
+        # A cancelled arrival doesn't lead to duplicated indexes
+        cancelled = self.loop.create_task(barrier.wait())
+        second = self.loop.create_task(barrier.wait())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        indexes = await asyncio.wait_for(
+            asyncio.gather(second, *(barrier.wait() for _ in range(2))), 1
+        )
+        self.assertEqual(sorted(indexes), [0, 1, 2])
+
+        with self.assertRaises(ValueError):
+            Barrier(0)
+
+    async def test_file_lock(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/lock"
+            # Two stacks on the same file exclude each other like two processes would
+            first = AsyncFileLockStack(path)
+            second = AsyncFileLockStack(path)
+
+            async with first(ReadLock), second(ReadLock):
+                pass
+
+            async with first(WriteLock):
+                waiter = self.loop.create_task(second(ReadLock).__aenter__())
+                await asyncio.sleep(0.05)
+                self.assertFalse(waiter.done())
+
+                with self.assertRaises(asyncio.TimeoutError):
+                    async with second(WriteLock, timeout=0.01):
+                        pass
+
+            await asyncio.wait_for(waiter, 1)
+            await second(ReadLock).__aexit__(None, None, None)
+
+            with self.assertRaises(ValueError):
+                first(Permits)
+
+            first.close()
+            second.close()
+
+    async def test_file_lock_coalesced(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = f"{tmp}/lock"
+            first = AsyncFileLockStack(path)
+            second = AsyncFileLockStack(path)
+            read_mock = Mock()
+
+            async def read():
+                async with second(ReadLock):
+                    read_mock(1)
+
+            async with first(WriteLock):
+                with patch.object(
+                    self.loop, "run_in_executor", wraps=self.loop.run_in_executor
+                ) as executor:
+                    tasks = [self.loop.create_task(read()) for _ in range(5)]
+                    await asyncio.sleep(0.05)
+                    executor.assert_called_once()
+
+            await asyncio.wait_for(asyncio.gather(*tasks), 1)
+            self.assertEqual(read_mock.call_count, 5)
+            self.assertIsNone(second._mode)
+
+            first.close()
+            second.close()
+
 
 if __name__ == "__main__":
     unittest.main()
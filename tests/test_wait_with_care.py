@@ -1,10 +1,17 @@
 # Standard
 from asyncio import CancelledError
+import sys
 import asyncio
 import unittest
 
 # External
-from async_tools import FIRST_EXCEPTION, wait_with_care
+from async_tools import (
+    FIRST_COMPLETED,
+    FIRST_EXCEPTION,
+    ErrorAggregator,
+    wait_with_care,
+    as_completed_with_care,
+)
 import asynctest
 
 
@@ -140,3 +147,157 @@ class WaitWithCareTestCase(asynctest.TestCase, unittest.TestCase):
         # Test again with futures set
         with self.assertRaisesRegex(Exception, "--Test Error--"):
             await wait_with_care(*futures, error_future, raise_first_error=True)
+
+    async def test_as_completed_with_care(self):
+        futures = [self.loop.create_future() for _ in range(10)]
+        for i in (3, 1, 7):
+            futures[i].set_result(i)
+
+        results = []
+        async for fut in as_completed_with_care(*futures):
+            results.append(fut.result())
+            if len(results) == 3:
+                for i, other in enumerate(futures):
+                    if not other.done():
+                        self.loop.call_soon(other.set_result, i)
+
+        # Futures done before iterating are yielded in argument order
+        self.assertEqual(results[:3], [1, 3, 7])
+        self.assertEqual(sorted(results), list(range(10)))
+
+        async for _ in as_completed_with_care():
+            self.fail("No futures to wait for")
+
+    async def test_as_completed_with_care_errors(self):
+        error_future = self.loop.create_future()
+        error_future.set_exception(Exception("--Test Error--"))
+        cancelled_future = self.loop.create_future()
+        cancelled_future.cancel()
+
+        done = [fut async for fut in as_completed_with_care(error_future)]
+        self.assertEqual(done, [error_future])
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            raise self.loop_exception["exception"]
+
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            async for _ in as_completed_with_care(error_future, raise_first_error=True):
+                pass
+
+        with self.assertRaises(CancelledError):
+            async for _ in as_completed_with_care(cancelled_future):
+                pass
+
+        done = [
+            fut async for fut in as_completed_with_care(cancelled_future, ignore_cancelled=True)
+        ]
+        self.assertEqual(done, [cancelled_future])
+
+    async def test_as_completed_with_care_early_exit(self):
+        futures = [self.loop.create_future() for _ in range(3)]
+        futures[0].set_result(0)
+
+        iterator = as_completed_with_care(*futures)
+        async for _ in iterator:
+            break
+        await iterator.aclose()
+
+        self.assertFalse(futures[1].cancelled())
+        self.assertFalse(futures[1]._callbacks)
+
+    async def test_wait_with_care_limit(self):
+        running = 0
+        max_running = 0
+
+        async def job(i):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return i
+
+        done, pending = await wait_with_care((job(i) for i in range(100)), limit=10)
+        self.assertFalse(pending)
+        self.assertEqual(sorted(fut.result() for fut in done), list(range(100)))
+        self.assertEqual(max_running, 10)
+
+        max_running = 0
+        done, pending = await wait_with_care(*(job(i) for i in range(20)), limit=5)
+        self.assertEqual(len(done), 20)
+        self.assertEqual(max_running, 5)
+
+        with self.assertRaises(ValueError):
+            await wait_with_care(self.loop.create_future(), limit=0)
+
+    async def test_wait_with_care_lazy_first_completed(self):
+        async def ok():
+            return "ok"
+
+        async def bad():
+            raise ValueError("--Test Error--")
+
+        done, pending = await wait_with_care(
+            iter([ok(), bad(), ok()]), return_when=FIRST_COMPLETED, eager=True
+        )
+
+        # Every future that already finished is in done, and its error was reported
+        self.assertEqual(len(done), 3)
+        self.assertEqual(len(pending), 0)
+        with self.assertRaisesRegex(ValueError, "--Test Error--"):
+            raise self.loop_exception["exception"]
+
+    async def test_wait_with_care_async_iterable(self):
+        consumed = []
+
+        async def source():
+            for i in range(10):
+                consumed.append(i)
+                yield asyncio.sleep(0.01 if i else 0, i)
+
+        done, pending = await wait_with_care(source(), limit=2, return_when=FIRST_COMPLETED)
+        self.assertEqual([fut.result() for fut in done], [0])
+        self.assertEqual(len(pending), 1)
+        # Only what was started was taken from the source
+        self.assertEqual(consumed, [0, 1])
+        await asyncio.gather(*pending)
+
+        done, pending = await wait_with_care(source())
+        self.assertEqual(sorted(fut.result() for fut in done), list(range(10)))
+
+        error_future = self.loop.create_future()
+        error_future.set_exception(Exception("--Test Error--"))
+        with self.assertRaisesRegex(Exception, "--Test Error--"):
+            await wait_with_care([error_future], limit=1, raise_first_error=True)
+
+    async def test_wait_with_care_reporter(self):
+        reports = []
+        self.loop.set_exception_handler(lambda loop, context: reports.append(context))
+
+        async def fail(i):
+            if i % 2:
+                raise KeyError(i)
+            raise ValueError(i)
+
+        reporter = ErrorAggregator(samples=2, interval=0.05)
+        done, pending = await wait_with_care(*(fail(i) for i in range(100)), reporter=reporter)
+        self.assertEqual(len(done), 100)
+        self.assertEqual(reports, [])
+
+        await asyncio.sleep(0)
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(sorted(reports[0]["errors"].values()), [50, 50])
+        self.assertIn("100 exceptions", reports[0]["message"])
+        if sys.version_info >= (3, 11):
+            self.assertEqual(len(reports[0]["exception"].exceptions), 4)
+
+        # Rate limited, the next report waits for the interval
+        await wait_with_care(fail(0), fail(2), reporter=reporter)
+        await asyncio.sleep(0)
+        self.assertEqual(len(reports), 1)
+
+        await asyncio.sleep(0.1)
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(list(reports[1]["errors"].values()), [2])
+
+        reporter.flush()
+        self.assertEqual(len(reports), 2)